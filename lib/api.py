@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from neo4j import Driver
+
 from lib.database import Neo4jClient
 from lib.models import Command, CommandWithMetadata
 from lib.settings import Settings
@@ -31,16 +33,24 @@ class MemoryBox:
         'command-id-456'
     """
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        driver: Driver | None = None,
+        initialize_schema: bool = True,
+    ) -> None:
         """Initialize Memory Box API.
 
         Args:
             settings: Settings object (defaults to loading from environment)
+            driver: Optional externally-managed Neo4j driver to reuse
+            initialize_schema: When False, skip the constraint/index DDL on
+                construction (the schema must already exist)
         """
         if settings is None:
             settings = Settings()
 
-        self._client = Neo4jClient(settings)
+        self._client = Neo4jClient(settings, driver=driver, initialize_schema=initialize_schema)
 
     def close(self) -> None:
         """Close the database connection."""
@@ -105,6 +115,24 @@ class MemoryBox:
 
         return self._client.add_command(cmd)
 
+    def add_commands(self, commands: list[Command]) -> list[str]:
+        """Add many commands to memory in a single batch.
+
+        Commands are written in one database round-trip, so this is much
+        faster than calling add_command in a loop when importing many
+        entries (e.g. from shell history). Duplicate detection is skipped.
+
+        Args:
+            commands: Command objects to store
+
+        Returns:
+            List of command IDs in input order
+
+        Example:
+            >>> ids = mb.add_commands([Command(command="git status", description="Show status")])
+        """
+        return self._client.add_commands(commands)
+
     def search_commands(
         self,
         query: str | None = None,
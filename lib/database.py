@@ -1,18 +1,50 @@
 """Neo4j database client for Memory Box."""
 
 import contextlib
+import functools
+import heapq
 import re
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any
 
-from neo4j import Driver, GraphDatabase
+from neo4j import Driver, GraphDatabase, Session, Transaction
 from neo4j.time import DateTime as Neo4jDateTime
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from lib.config import CATEGORIES_MAP, COMMAND_MAP, SECRETS_PATTERNS, TAGS_MAP
 from lib.models import Command, CommandWithMetadata
 from lib.settings import Settings
 
+# Compile secret patterns once at import time; _obfuscate_secrets runs on every
+# add_command call and per-call re.compile/cache churn adds up. Pattern order
+# from secrets.json is preserved.
+# Each pattern carries its own sentinel substrings from the config, so the
+# regex only runs against commands where it could possibly match.
+_COMPILED_SECRETS_PATTERNS: list[tuple[re.Pattern[str], str, tuple[str, ...]]] = [
+    (re.compile(p["pattern"], re.IGNORECASE), p["replacement"], tuple(p.get("sentinels", ())))
+    for p in SECRETS_PATTERNS
+]
+
+# Cheap substring sentinels covering every secret pattern. Most commands
+# ("docker ps", "git status", ...) contain none of these, so we can skip the
+# regex pipeline entirely with a handful of C-level substring scans. A pattern
+# without configured sentinels disables the whole-command fast reject.
+_SECRET_SENTINELS: tuple[str, ...] = tuple(
+    {sentinel for p in SECRETS_PATTERNS for sentinel in p.get("sentinels", ())}
+)
+_ALL_PATTERNS_HAVE_SENTINELS = all(p.get("sentinels") for p in SECRETS_PATTERNS)
+
+# Cache key for search results: all search_commands parameters that affect the result
+_SearchCacheKey = tuple[
+    str | None, bool, int, str | None, str | None, str | None, tuple[str, ...] | None, int
+]
+
 
 def _detect_category_and_tags(command: str) -> tuple[str | None, list[str]]:
     """Detect category and tags from command text.
@@ -48,13 +80,163 @@ def _convert_neo4j_datetime(value: datetime | Neo4jDateTime | None) -> datetime
     return value
 
 
+# Characters with special meaning in Lucene query syntax
+_LUCENE_SPECIAL_RE = re.compile(r'[+\-&|!(){}\[\]^"~*?:\\/]')
+
+# Maximum fuzzy match score; candidates at this score cannot improve further
+_PERFECT_SCORE = 100.0
+
+# Candidate fields considered by fuzzy matching
+_FUZZY_FIELDS = ("command", "description", "context")
+
+# Shared flat projection for command queries. Returning scalar columns avoids
+# shipping whole nodes over Bolt and lets hydration read plain record values
+# instead of going through the Node proxy's __getitem__ per field.
+_COMMAND_RETURN = """
+        RETURN c.id AS id,
+               c.command AS command,
+               c.description AS description,
+               c.context AS context,
+               c.status AS status,
+               c.created_at AS created_at,
+               c.last_used AS last_used,
+               c.use_count AS use_count,
+               c.execution_count AS execution_count,
+               c.success_count AS success_count,
+               c.failure_count AS failure_count,
+               c.sigbits AS sigbits,
+               tags, oses, categories, project_types"""
+
+
+def _build_lucene_fuzzy_query(query: str) -> str:
+    """Build a Lucene query with per-token fuzzy and prefix clauses.
+
+    Each token matches with an edit-distance budget scaled to its length
+    (longer tokens tolerate more edits) and as a prefix, so e.g. "kube"
+    still finds "kubectl". Returns an empty string when the query has no
+    usable tokens.
+    """
+    clauses = []
+    for token in (_LUCENE_SPECIAL_RE.sub("", tok) for tok in query.split()):
+        if not token:
+            continue
+        if len(token) <= 2:  # noqa: PLR2004
+            clauses.append(f"{token}*")
+        elif len(token) <= 5:  # noqa: PLR2004
+            clauses.append(f"{token}~1 OR {token}*")
+        else:
+            clauses.append(f"{token}~2 OR {token}*")
+
+    return " OR ".join(clauses)
+
+
+@functools.lru_cache(maxsize=4096)
+def _lower(text: str) -> str:
+    """Lowercase with a process-level cache.
+
+    Stored command/description/context strings are stable across searches,
+    so repeated fuzzy queries can reuse the lowercased copies instead of
+    re-allocating them per query.
+    """
+    return text.lower()
+
+
+def _char_signature(text: str) -> int:
+    """Build a 64-bit character-presence bitmap for *text*.
+
+    Each character maps to one of 64 buckets; a set bit means some character
+    of that bucket occurs in the text. Signatures of stored commands let the
+    fuzzy matcher reject candidates that cannot reach the score threshold
+    with a couple of integer ops instead of a Levenshtein call.
+    """
+    bits = 0
+    for ch in set(text):
+        bits |= 1 << (ord(ch) & 63)
+    return bits
+
+
+def _signature_allows(cmd: CommandWithMetadata, qbits: int, qlen: int, threshold: int) -> bool:
+    """Check whether a candidate could still meet the fuzzy *threshold*.
+
+    Query characters whose signature bucket is absent from the candidate can
+    never be matched, which caps the matchable characters at
+    ``k = qlen - missing``. partial_ratio scores ``200 * M / (len_s + len_w)``
+    with the shorter side ``len_s = min(qlen, L)`` compared against windows of
+    the longer side, and ``M <= min(k, len_s) <= len_w``, so the best possible
+    score per field is ``200 * m / (len_s + m)`` with ``m = min(k, len_s)``.
+    Candidates without a stored signature always pass.
+    """
+    if cmd.sigbits is None:
+        return True
+    missing = (qbits & ~cmd.sigbits).bit_count()
+    if not missing:
+        return True
+    matchable = qlen - missing
+    if matchable <= 0:
+        # No query character can match anything in the candidate
+        return threshold <= 0
+    for value in (cmd.command, cmd.description, cmd.context or ""):
+        length = len(value)
+        if not length:
+            continue
+        shorter = qlen if qlen < length else length
+        m = matchable if matchable < shorter else shorter
+        if 200 * m / (shorter + m) >= threshold:
+            return True
+    return False
+
+
+def _record_to_command(record: Mapping[str, Any]) -> CommandWithMetadata | None:
+    """Hydrate a flat ``_COMMAND_RETURN`` record into a model.
+
+    Returns None for records with invalid timestamps so callers can drop
+    them. The first OS/category/project_type is used for backwards
+    compatibility (CommandWithMetadata expects single values).
+
+    Uses ``model_construct`` to skip Pydantic validation: every field comes
+    from our own writes, already typed by the driver, so re-validating each
+    row on the hot read path is pure overhead.
+    """
+    created_at = _convert_neo4j_datetime(record["created_at"])
+    if created_at is None:
+        return None
+
+    oses = record["oses"]
+    categories = record["categories"]
+    project_types = record["project_types"]
+
+    return CommandWithMetadata.model_construct(
+        id=record["id"],
+        command=record["command"],
+        description=record["description"],
+        tags=record["tags"],
+        os=oses[0] if oses else None,
+        project_type=project_types[0] if project_types else None,
+        context=record["context"],
+        category=categories[0] if categories else None,
+        status=record["status"],
+        created_at=created_at,
+        last_used=_convert_neo4j_datetime(record["last_used"]),
+        use_count=record["use_count"] or 0,
+        execution_count=record["execution_count"] or 0,
+        success_count=record["success_count"] or 0,
+        failure_count=record["failure_count"] or 0,
+        sigbits=record.get("sigbits"),
+    )
+
+
 def _obfuscate_secrets(command: str) -> str:
     """Obfuscate passwords and secrets in commands."""
+    low = command.lower()
+    if _ALL_PATTERNS_HAVE_SENTINELS and not any(sentinel in low for sentinel in _SECRET_SENTINELS):
+        # No pattern can possibly match; skip the regex pipeline.
+        return command.rstrip()
+
     obfuscated = command
-    for pattern_config in SECRETS_PATTERNS:
-        pattern = pattern_config["pattern"]
-        replacement = pattern_config["replacement"]
-        obfuscated = re.sub(pattern, replacement, obfuscated, flags=re.IGNORECASE)
+    for pattern, replacement, sentinels in _COMPILED_SECRETS_PATTERNS:
+        if sentinels and not any(sentinel in low for sentinel in sentinels):
+            continue
+        obfuscated = pattern.sub(replacement, obfuscated)
 
     return obfuscated.rstrip()
 
@@ -62,38 +244,155 @@ def _obfuscate_secrets(command: str) -> str:
 class Neo4jClient:
     """Client for interacting with Neo4j database."""
 
-    def __init__(self, settings: Settings) -> None:
-        """Initialize the Neo4j client."""
-        self.driver: Driver = GraphDatabase.driver(
+    # Bounds for the process-local search result cache. Repeated identical
+    # queries (up-arrow recall, incremental typing) are common in interactive
+    # use, so short-lived memoization saves a full round-trip plus scoring.
+    _SEARCH_CACHE_MAXSIZE = 256
+    _SEARCH_CACHE_TTL_SECONDS = 30.0
+
+    # Batch size from which add_commands parallelizes secret obfuscation;
+    # below this the thread pool costs more than it saves
+    _PARALLEL_OBFUSCATION_MIN = 64
+
+    def __init__(
+        self,
+        settings: Settings,
+        driver: Driver | None = None,
+        initialize_schema: bool = True,
+    ) -> None:
+        """Initialize the Neo4j client.
+
+        Args:
+            settings: Connection settings
+            driver: Optional externally-managed driver to reuse; when given,
+                its connection pool is shared and close() leaves it open
+            initialize_schema: When False, skip the constraint/index DDL on
+                construction (call ensure_schema() separately, e.g. once per
+                process) and only probe for optional server features
+        """
+        self._owns_driver = driver is None
+        self.driver: Driver = driver or GraphDatabase.driver(
             settings.neo4j_uri, auth=(settings.neo4j_user, settings.neo4j_password)
         )
         self.database = settings.neo4j_database
-        self._initialize_constraints()
+        self._search_cache: OrderedDict[
+            _SearchCacheKey, tuple[float, list[CommandWithMetadata]]
+        ] = OrderedDict()
+        self._search_cache_hits = 0
+        self._search_cache_misses = 0
+        # Lazily populated tag/category sets, kept in sync by the write paths
+        self._tag_cache: set[str] | None = None
+        self._category_cache: set[str] | None = None
+        self._local = threading.local()
+        self._owned_sessions: list[Session] = []
+        self._sessions_lock = threading.Lock()
+        self._fulltext_available = False
+        self._apoc_available = False
+        if initialize_schema:
+            self.ensure_schema()
+        else:
+            self._detect_capabilities()
+
+    def _session(self) -> Session:
+        """Return a long-lived session for the current thread.
+
+        Opening a session per method call acquires and tears down a pooled
+        connection each time, which costs more than a small Cypher round-trip.
+        Sessions are not thread-safe, so each thread lazily opens its own and
+        reuses it; all of them are closed in close().
+        """
+        session: Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = self.driver.session(database=self.database)
+            self._local.session = session
+            with self._sessions_lock:
+                self._owned_sessions.append(session)
+        return session
+
+    def _override_tx(self, tx: Transaction) -> None:
+        """Route every query in the calling thread through an external transaction.
+
+        Tests use this for rollback isolation: _session() hands out the
+        transaction instead of opening sessions, and the caller keeps
+        ownership (close() will not touch it). Fulltext indexes cannot see
+        the transaction's own uncommitted writes, so the fulltext search
+        path is disabled while overridden.
+        """
+        self._local.session = tx
+        self._fulltext_available = False
 
     def close(self) -> None:
-        """Close the database connection."""
-        self.driver.close()
+        """Close all open sessions and, if owned, the database connection."""
+        with self._sessions_lock:
+            sessions, self._owned_sessions = self._owned_sessions, []
+        for session in sessions:
+            with contextlib.suppress(Exception):
+                session.close()
+        if self._owns_driver:
+            self.driver.close()
 
-    def _initialize_constraints(self) -> None:
-        """Create necessary constraints and indexes."""
+    def _run_statement(self, statement: str) -> None:
         with self.driver.session(database=self.database) as session:
+            session.run(statement)
+
+    def _probe_statement(self, statement: str) -> bool:
+        # Statement may fail if the feature is unsupported (e.g. older
+        # Neo4j without fulltext indexes, or APOC not installed)
+        with (
+            contextlib.suppress(Exception),
+            self.driver.session(database=self.database) as session,
+        ):
+            session.run(statement).consume()
+            return True
+        return False
+
+    def ensure_schema(self) -> None:
+        """Create necessary constraints and indexes.
+
+        The statements are idempotent and independent, so they run
+        concurrently on separate sessions; startup pays roughly one
+        round-trip instead of one per statement.
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
             # Ensure unique IDs for commands
-            session.run(
+            constraint = executor.submit(
+                self._run_statement,
                 "CREATE CONSTRAINT command_id_unique IF NOT EXISTS "
-                "FOR (c:Command) REQUIRE c.id IS UNIQUE"
+                "FOR (c:Command) REQUIRE c.id IS UNIQUE",
             )
             # Index for faster text search
-            session.run(
+            index = executor.submit(
+                self._run_statement,
                 "CREATE INDEX command_text_index IF NOT EXISTS "
-                "FOR (c:Command) ON (c.command, c.description)"
+                "FOR (c:Command) ON (c.command, c.description)",
             )
             # Full-text index for fuzzy search
-            with contextlib.suppress(Exception):
-                # Index might already exist or Neo4j version doesn't support it
-                session.run(
-                    "CREATE FULLTEXT INDEX command_fulltext IF NOT EXISTS "
-                    "FOR (c:Command) ON EACH [c.command, c.description, c.context]"
-                )
+            fulltext = executor.submit(
+                self._probe_statement,
+                "CREATE FULLTEXT INDEX command_fulltext IF NOT EXISTS "
+                "FOR (c:Command) ON EACH [c.command, c.description, c.context]",
+            )
+            # Detect APOC once; when available, fuzzy scoring can run
+            # server-side instead of transporting all candidates over Bolt
+            apoc = executor.submit(self._probe_statement, "RETURN apoc.version()")
+
+            constraint.result()
+            index.result()
+            self._fulltext_available = fulltext.result()
+            self._apoc_available = apoc.result()
+
+    def _detect_capabilities(self) -> None:
+        """Probe optional server features without running any schema DDL."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fulltext = executor.submit(
+                self._probe_statement,
+                "CALL db.index.fulltext.queryNodes('command_fulltext', 'probe') "
+                "YIELD node RETURN count(node)",
+            )
+            apoc = executor.submit(self._probe_statement, "RETURN apoc.version()")
+
+            self._fulltext_available = fulltext.result()
+            self._apoc_available = apoc.result()
 
     def add_command(self, command: Command) -> str:
         """Add a command or update execution stats if it already exists.
@@ -105,6 +404,9 @@ class Neo4jClient:
 
         If the command is new, it creates a new Command node.
         """
+        # Cached search results may no longer reflect the stored commands
+        self._search_cache.clear()
+
         # Always strip secrets from command before storing
         command_text = _obfuscate_secrets(command.command)
 
@@ -117,135 +419,293 @@ class Neo4jClient:
         # Merge user-provided tags with auto-detected tags
         all_tags = list(set(command.tags + detected_tags))
 
-        with self.driver.session(database=self.database) as session:
-            # Check if command already exists
-            result = session.run(
+        # Character signature over every searchable field, for fuzzy prefiltering
+        sigbits = _char_signature(
+            f"{command_text} {command.description} {command.context or ''}".lower()
+        )
+
+        session = self._session()
+        # Check if command already exists
+        result = session.run(
+            """
+            MATCH (c:Command {command: $command})
+            RETURN c.id as id
+            """,
+            command=command_text,
+        )
+        existing = result.single()
+
+        if existing:
+            # Update existing command's execution statistics
+            command_id = existing["id"]
+            session.run(
                 """
-                MATCH (c:Command {command: $command})
-                RETURN c.id as id
+                MATCH (c:Command {id: $id})
+                SET c.description = $description,
+                    c.context = $context,
+                    c.sigbits = $sigbits,
+                    c.execution_count = c.execution_count + 1,
+                    c.success_count = c.success_count +
+                        CASE WHEN $status = 'success' THEN 1 ELSE 0 END,
+                    c.failure_count = c.failure_count +
+                        CASE WHEN $status = 'failed' THEN 1 ELSE 0 END
+                WITH c
+
+                // Merge new tags (don't remove existing ones)
+                UNWIND $tags AS tag
+                MERGE (t:Tag {name: tag})
+                MERGE (c)-[:TAGGED_WITH]->(t)
+
+                WITH c
+                // Merge category relationship (command may gain new category)
+                FOREACH (_ IN CASE WHEN $category IS NOT NULL THEN [1] ELSE [] END |
+                    MERGE (cat:Category {name: $category})
+                    MERGE (c)-[:HAS_CATEGORY]->(cat)
+                )
+
+                WITH c
+                // Merge OS relationship (command may be run on multiple OSes)
+                FOREACH (_ IN CASE WHEN $os IS NOT NULL THEN [1] ELSE [] END |
+                    MERGE (o:OS {name: $os})
+                    MERGE (c)-[:RUNS_ON]->(o)
+                )
+
+                WITH c
+                // Merge project type relationship
+                FOREACH (_ IN CASE WHEN $project_type IS NOT NULL THEN [1] ELSE [] END |
+                    MERGE (pt:ProjectType {name: $project_type})
+                    MERGE (c)-[:FOR_PROJECT]->(pt)
+                )
                 """,
-                command=command_text,
+                id=command_id,
+                description=command.description,
+                context=command.context,
+                sigbits=sigbits,
+                status=command.status,
+                tags=all_tags,
+                category=category,
+                os=command.os,
+                project_type=command.project_type,
             )
-            existing = result.single()
-
-            if existing:
-                # Update existing command's execution statistics
-                command_id = existing["id"]
-                session.run(
-                    """
-                    MATCH (c:Command {id: $id})
-                    SET c.description = $description,
-                        c.context = $context,
-                        c.execution_count = c.execution_count + 1,
-                        c.success_count = c.success_count +
-                            CASE WHEN $status = 'success' THEN 1 ELSE 0 END,
-                        c.failure_count = c.failure_count +
-                            CASE WHEN $status = 'failed' THEN 1 ELSE 0 END
-                    WITH c
-
-                    // Merge new tags (don't remove existing ones)
-                    UNWIND $tags AS tag
+        else:
+            # Create new command
+            command_id = str(uuid.uuid4())
+            execution_count = 1 if command.status else 0
+            success_count = 1 if command.status == "success" else 0
+            failure_count = 1 if command.status == "failed" else 0
+
+            session.run(
+                """
+                CREATE (c:Command {
+                    id: $id,
+                    command: $command,
+                    description: $description,
+                    context: $context,
+                    sigbits: $sigbits,
+                    created_at: $created_at,
+                    last_used: NULL,
+                    use_count: 0,
+                    execution_count: $execution_count,
+                    success_count: $success_count,
+                    failure_count: $failure_count
+                })
+                WITH c
+
+                // Create and link tags
+                WITH c, $tags AS tag_list
+                UNWIND CASE WHEN size(tag_list) > 0 THEN tag_list ELSE [null] END AS tag
+                FOREACH (_ IN CASE WHEN tag IS NOT NULL THEN [1] ELSE [] END |
                     MERGE (t:Tag {name: tag})
                     MERGE (c)-[:TAGGED_WITH]->(t)
+                )
 
-                    WITH c
-                    // Merge category relationship (command may gain new category)
-                    FOREACH (_ IN CASE WHEN $category IS NOT NULL THEN [1] ELSE [] END |
-                        MERGE (cat:Category {name: $category})
-                        MERGE (c)-[:HAS_CATEGORY]->(cat)
-                    )
-
-                    WITH c
-                    // Merge OS relationship (command may be run on multiple OSes)
-                    FOREACH (_ IN CASE WHEN $os IS NOT NULL THEN [1] ELSE [] END |
-                        MERGE (o:OS {name: $os})
-                        MERGE (c)-[:RUNS_ON]->(o)
-                    )
-
-                    WITH c
-                    // Merge project type relationship
-                    FOREACH (_ IN CASE WHEN $project_type IS NOT NULL THEN [1] ELSE [] END |
-                        MERGE (pt:ProjectType {name: $project_type})
-                        MERGE (c)-[:FOR_PROJECT]->(pt)
-                    )
-                    """,
-                    id=command_id,
-                    description=command.description,
-                    context=command.context,
-                    status=command.status,
-                    tags=all_tags,
-                    category=category,
-                    os=command.os,
-                    project_type=command.project_type,
+                WITH c
+                // Create and link category
+                FOREACH (_ IN CASE WHEN $category IS NOT NULL THEN [1] ELSE [] END |
+                    MERGE (cat:Category {name: $category})
+                    MERGE (c)-[:HAS_CATEGORY]->(cat)
                 )
-            else:
-                # Create new command
-                command_id = str(uuid.uuid4())
-                execution_count = 1 if command.status else 0
-                success_count = 1 if command.status == "success" else 0
-                failure_count = 1 if command.status == "failed" else 0
-
-                session.run(
-                    """
-                    CREATE (c:Command {
-                        id: $id,
-                        command: $command,
-                        description: $description,
-                        context: $context,
-                        created_at: datetime($created_at),
-                        last_used: NULL,
-                        use_count: 0,
-                        execution_count: $execution_count,
-                        success_count: $success_count,
-                        failure_count: $failure_count
-                    })
-                    WITH c
-
-                    // Create and link tags
-                    WITH c, $tags AS tag_list
-                    UNWIND CASE WHEN size(tag_list) > 0 THEN tag_list ELSE [null] END AS tag
-                    FOREACH (_ IN CASE WHEN tag IS NOT NULL THEN [1] ELSE [] END |
-                        MERGE (t:Tag {name: tag})
-                        MERGE (c)-[:TAGGED_WITH]->(t)
-                    )
-
-                    WITH c
-                    // Create and link category
-                    FOREACH (_ IN CASE WHEN $category IS NOT NULL THEN [1] ELSE [] END |
-                        MERGE (cat:Category {name: $category})
-                        MERGE (c)-[:HAS_CATEGORY]->(cat)
-                    )
-
-                    WITH c
-                    // Create and link OS
-                    FOREACH (_ IN CASE WHEN $os IS NOT NULL THEN [1] ELSE [] END |
-                        MERGE (o:OS {name: $os})
-                        MERGE (c)-[:RUNS_ON]->(o)
-                    )
-
-                    WITH c
-                    // Create and link project type
-                    FOREACH (_ IN CASE WHEN $project_type IS NOT NULL THEN [1] ELSE [] END |
-                        MERGE (pt:ProjectType {name: $project_type})
-                        MERGE (c)-[:FOR_PROJECT]->(pt)
-                    )
-                    """,
-                    id=command_id,
-                    command=command_text,
-                    description=command.description,
-                    context=command.context,
-                    tags=all_tags,
-                    created_at=datetime.now().astimezone().isoformat(),
-                    execution_count=execution_count,
-                    success_count=success_count,
-                    failure_count=failure_count,
-                    category=category,
-                    os=command.os,
-                    project_type=command.project_type,
+
+                WITH c
+                // Create and link OS
+                FOREACH (_ IN CASE WHEN $os IS NOT NULL THEN [1] ELSE [] END |
+                    MERGE (o:OS {name: $os})
+                    MERGE (c)-[:RUNS_ON]->(o)
                 )
 
+                WITH c
+                // Create and link project type
+                FOREACH (_ IN CASE WHEN $project_type IS NOT NULL THEN [1] ELSE [] END |
+                    MERGE (pt:ProjectType {name: $project_type})
+                    MERGE (c)-[:FOR_PROJECT]->(pt)
+                )
+                """,
+                id=command_id,
+                command=command_text,
+                description=command.description,
+                context=command.context,
+                sigbits=sigbits,
+                tags=all_tags,
+                created_at=Neo4jDateTime.from_native(datetime.now().astimezone()),
+                execution_count=execution_count,
+                success_count=success_count,
+                failure_count=failure_count,
+                category=category,
+                os=command.os,
+                project_type=command.project_type,
+            )
+
+        if self._tag_cache is not None:
+            self._tag_cache.update(all_tags)
+        if self._category_cache is not None and category is not None:
+            self._category_cache.add(category)
+
         return str(command_id)
 
+    def add_commands(self, commands: list[Command]) -> list[str]:
+        """Add many commands in two batched statements.
+
+        Unlike add_command, this always creates new Command nodes and skips
+        the per-command existence check, so it is intended for bulk imports
+        (e.g. loading shell history) where commands are known to be new.
+
+        Returns the generated command IDs in input order.
+        """
+        if not commands:
+            return []
+
+        # Cached search results may no longer reflect the stored commands
+        self._search_cache.clear()
+
+        command_ids = [str(uuid.uuid4()) for _ in commands]
+        created_at = Neo4jDateTime.from_native(datetime.now().astimezone())
+
+        # Secret obfuscation is the CPU-heavy part of row preparation; spread
+        # it over a small thread pool for history-sized imports
+        if len(commands) >= self._PARALLEL_OBFUSCATION_MIN:
+            with ThreadPoolExecutor(max_workers=min(8, len(commands))) as executor:
+                command_texts = list(
+                    executor.map(_obfuscate_secrets, (cmd.command for cmd in commands))
+                )
+        else:
+            command_texts = [_obfuscate_secrets(cmd.command) for cmd in commands]
+
+        rows = []
+        batch_tags: set[str] = set()
+        batch_categories: set[str] = set()
+        batch_oses: set[str] = set()
+        batch_project_types: set[str] = set()
+        for command_id, command, command_text in zip(
+            command_ids, commands, command_texts, strict=True
+        ):
+            detected_category, detected_tags = _detect_category_and_tags(command.command)
+            all_tags = list(set(command.tags + detected_tags))
+            category = command.category or detected_category
+            batch_tags.update(all_tags)
+            if category is not None:
+                batch_categories.add(category)
+            if command.os is not None:
+                batch_oses.add(command.os)
+            if command.project_type is not None:
+                batch_project_types.add(command.project_type)
+            rows.append(
+                {
+                    "id": command_id,
+                    "command": command_text,
+                    "description": command.description,
+                    "context": command.context,
+                    "sigbits": _char_signature(
+                        f"{command_text} {command.description} {command.context or ''}".lower()
+                    ),
+                    "created_at": created_at,
+                    "execution_count": 1 if command.status else 0,
+                    "success_count": 1 if command.status == "success" else 0,
+                    "failure_count": 1 if command.status == "failed" else 0,
+                    "tags": all_tags,
+                    "category": category,
+                    "os": command.os,
+                    "project_type": command.project_type,
+                }
+            )
+
+        session = self._session()
+
+        # Merge the distinct metadata nodes first, so MERGE work is
+        # proportional to the unique values in the batch rather than
+        # command count x tags per command; the row statement below can
+        # then MATCH and link without per-row existence checks.
+        session.run(
+            """
+            FOREACH (name IN $tags | MERGE (:Tag {name: name}))
+            FOREACH (name IN $categories | MERGE (:Category {name: name}))
+            FOREACH (name IN $oses | MERGE (:OS {name: name}))
+            FOREACH (name IN $project_types | MERGE (:ProjectType {name: name}))
+            """,
+            tags=sorted(batch_tags),
+            categories=sorted(batch_categories),
+            oses=sorted(batch_oses),
+            project_types=sorted(batch_project_types),
+        )
+
+        session.run(
+            """
+            UNWIND $rows AS row
+            CREATE (c:Command {
+                id: row.id,
+                command: row.command,
+                description: row.description,
+                context: row.context,
+                sigbits: row.sigbits,
+                created_at: row.created_at,
+                last_used: NULL,
+                use_count: 0,
+                execution_count: row.execution_count,
+                success_count: row.success_count,
+                failure_count: row.failure_count
+            })
+            WITH c, row
+
+            CALL {
+                WITH c, row
+                UNWIND row.tags AS tag
+                MATCH (t:Tag {name: tag})
+                CREATE (c)-[:TAGGED_WITH]->(t)
+            }
+
+            CALL {
+                WITH c, row
+                WITH c, row
+                WHERE row.category IS NOT NULL
+                MATCH (cat:Category {name: row.category})
+                CREATE (c)-[:HAS_CATEGORY]->(cat)
+            }
+
+            CALL {
+                WITH c, row
+                WITH c, row
+                WHERE row.os IS NOT NULL
+                MATCH (o:OS {name: row.os})
+                CREATE (c)-[:RUNS_ON]->(o)
+            }
+
+            CALL {
+                WITH c, row
+                WITH c, row
+                WHERE row.project_type IS NOT NULL
+                MATCH (pt:ProjectType {name: row.project_type})
+                CREATE (c)-[:FOR_PROJECT]->(pt)
+            }
+            """,
+            rows=rows,
+        )
+
+        if self._tag_cache is not None:
+            self._tag_cache.update(batch_tags)
+        if self._category_cache is not None:
+            self._category_cache.update(batch_categories)
+
+        return command_ids
+
     def search_commands(
         self,
         query: str | None = None,
@@ -269,50 +729,83 @@ class Neo4jClient:
             fuzzy: Enable fuzzy matching for query
             fuzzy_threshold: Minimum similarity score (0-100) for fuzzy matches
         """
-        # Fetch candidates from database with structural filters only
-        candidates = self._fetch_command_candidates(
-            os=os,
-            project_type=project_type,
-            category=category,
-            tags=tags,
-            query=query if not fuzzy else None,  # Skip text filter for fuzzy
+        cache_key: _SearchCacheKey = (
+            query,
+            fuzzy,
+            fuzzy_threshold,
+            os,
+            project_type,
+            category,
+            tuple(sorted(tags)) if tags else None,
+            limit,
         )
-
-        # Apply text matching (exact or fuzzy)
-        if query:
-            if fuzzy:
-                return self._apply_fuzzy_matching(candidates, query, fuzzy_threshold, limit)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+
+        if query and fuzzy:
+            results = self._fuzzy_search(
+                query,
+                fuzzy_threshold,
+                limit,
+                os=os,
+                project_type=project_type,
+                category=category,
+                tags=tags,
+            )
+        else:
             # Exact match already filtered in query, just limit
-            return candidates[:limit]
-
-        return candidates[:limit]
-
-    def _fetch_command_candidates(
-        self,
-        os: str | None = None,
-        project_type: str | None = None,
-        category: str | None = None,
-        tags: list[str] | None = None,
-        query: str | None = None,
-    ) -> list[CommandWithMetadata]:
-        """Fetch command candidates from database with structural filters.
-
-        This method handles all database-level filtering (OS, project type,
-        category, tags, and optional exact text matching). Text matching
-        is only applied here for exact searches, not fuzzy searches.
-        """
-        where_clauses = []
-        params: dict[str, str | list[str]] = {}
-
-        # Text search (only for exact matching, not fuzzy)
-        if query:
-            where_clauses.append(
-                "(c.command CONTAINS $query OR c.description CONTAINS $query OR "
-                "c.context CONTAINS $query)"
+            candidates = self._fetch_command_candidates(
+                os=os, project_type=project_type, category=category, tags=tags, query=query
             )
-            params["query"] = query
-
-        # Build relationship filters
+            results = candidates[:limit]
+
+        self._store_cached_search(cache_key, results)
+        return results
+
+    def _get_cached_search(self, cache_key: _SearchCacheKey) -> list[CommandWithMetadata] | None:
+        """Return a fresh cached result for the key, or None on a miss."""
+        entry = self._search_cache.get(cache_key)
+        if entry is not None:
+            stored_at, results = entry
+            if time.monotonic() - stored_at < self._SEARCH_CACHE_TTL_SECONDS:
+                self._search_cache.move_to_end(cache_key)
+                self._search_cache_hits += 1
+                return list(results)
+            del self._search_cache[cache_key]
+
+        self._search_cache_misses += 1
+        return None
+
+    def _store_cached_search(
+        self, cache_key: _SearchCacheKey, results: list[CommandWithMetadata]
+    ) -> None:
+        """Store a search result, evicting the least recently used entry if full."""
+        self._search_cache[cache_key] = (time.monotonic(), list(results))
+        if len(self._search_cache) > self._SEARCH_CACHE_MAXSIZE:
+            self._search_cache.popitem(last=False)
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size of the search result cache."""
+        return {
+            "hits": self._search_cache_hits,
+            "misses": self._search_cache_misses,
+            "size": len(self._search_cache),
+        }
+
+    @staticmethod
+    def _build_structural_filters(
+        os: str | None,
+        project_type: str | None,
+        category: str | None,
+        tags: list[str] | None,
+    ) -> tuple[list[str], str, dict[str, str | int | list[str]]]:
+        """Build relationship MATCH clauses and tag filter for command queries.
+
+        Returns the relationship filter clauses, the tag match fragment and
+        the query parameters they reference.
+        """
+        params: dict[str, str | int | list[str]] = {}
         relationship_filters = []
 
         if os:
@@ -341,6 +834,35 @@ class Neo4jClient:
             """
             params["tags"] = list(tags)
 
+        return relationship_filters, tag_match, params
+
+    def _fetch_command_candidates(
+        self,
+        os: str | None = None,
+        project_type: str | None = None,
+        category: str | None = None,
+        tags: list[str] | None = None,
+        query: str | None = None,
+    ) -> list[CommandWithMetadata]:
+        """Fetch command candidates from database with structural filters.
+
+        This method handles all database-level filtering (OS, project type,
+        category, tags, and optional exact text matching). Text matching
+        is only applied here for exact searches, not fuzzy searches.
+        """
+        relationship_filters, tag_match, params = self._build_structural_filters(
+            os, project_type, category, tags
+        )
+
+        # Text search (only for exact matching, not fuzzy)
+        where_clauses = []
+        if query:
+            where_clauses.append(
+                "(c.command CONTAINS $query OR c.description CONTAINS $query OR "
+                "c.context CONTAINS $query)"
+            )
+            params["query"] = query
+
         # Build WHERE clause
         where_clause = ""
         if where_clauses:
@@ -365,15 +887,94 @@ class Neo4jClient:
              collect(DISTINCT cat.name) as categories,
              collect(DISTINCT pt.name) as project_types
         ORDER BY c.execution_count DESC, c.created_at DESC
-        RETURN c, tags, oses, categories, project_types
+        {_COMMAND_RETURN}
+        """
+
+        return self._run_command_query(final_query, params)
+
+    def _run_command_query(
+        self, final_query: str, params: dict[str, str | int | list[str]]
+    ) -> list[CommandWithMetadata]:
+        """Execute a command query and hydrate the results into models.
+
+        Queries must end with ``_COMMAND_RETURN`` so records arrive as flat
+        scalar columns rather than Node objects.
         """
+        session = self._session()
+        result = session.run(final_query, params)
+        # Records with invalid timestamps hydrate to None and are skipped
+        return [cmd for cmd in map(_record_to_command, result) if cmd is not None]
+
+    def _fuzzy_search(
+        self,
+        query: str,
+        threshold: int,
+        limit: int,
+        *,
+        os: str | None = None,
+        project_type: str | None = None,
+        category: str | None = None,
+        tags: list[str] | None = None,
+    ) -> list[CommandWithMetadata]:
+        """Run a fuzzy search using the cheapest available strategy.
+
+        Preferred order: fulltext-index candidate pruning (O(log N) on the
+        indexed side) with RapidFuzz re-scoring, then APOC server-side
+        scoring, then a full candidate scan scored client-side.
+        """
+        if self._fulltext_available:
+            candidates = self._fuzzy_candidates_fulltext(
+                query, os=os, project_type=project_type, category=category, tags=tags
+            )
+            if candidates is not None:
+                return self._apply_fuzzy_matching(candidates, query, threshold, limit)
+
+        if self._apoc_available:
+            return self._fuzzy_search_apoc(
+                query,
+                threshold,
+                limit,
+                os=os,
+                project_type=project_type,
+                category=category,
+                tags=tags,
+            )
+
+        candidates = self._fetch_command_candidates(
+            os=os, project_type=project_type, category=category, tags=tags
+        )
+        return self._apply_fuzzy_matching(candidates, query, threshold, limit)
+
+    def _fuzzy_candidates_fulltext(
+        self,
+        query: str,
+        *,
+        os: str | None = None,
+        project_type: str | None = None,
+        category: str | None = None,
+        tags: list[str] | None = None,
+    ) -> list[CommandWithMetadata] | None:
+        """Fetch fuzzy-search candidates through the fulltext index.
+
+        Lucene prunes candidates with per-token fuzzy (``term~n``) and prefix
+        (``term*``) clauses instead of streaming the whole corpus; the
+        RapidFuzz scoring pass still decides the final ranking. Returns None
+        when the index cannot serve the query so the caller can fall back.
+        """
+        lucene_query = _build_lucene_fuzzy_query(query)
+        if not lucene_query:
+            return None
+
+        relationship_filters, tag_match, params = self._build_structural_filters(
+            os, project_type, category, tags
+        )
+        params["lucene_query"] = lucene_query
 
-        # Update query to also fetch OS, category, project_type from relationships
         final_query = f"""
-        MATCH (c:Command)
+        CALL db.index.fulltext.queryNodes('command_fulltext', $lucene_query)
+        YIELD node AS c
         {chr(10).join(relationship_filters)}
         {tag_match}
-        {where_clause}
         OPTIONAL MATCH (c)-[:TAGGED_WITH]->(t:Tag)
         OPTIONAL MATCH (c)-[:RUNS_ON]->(os:OS)
         OPTIONAL MATCH (c)-[:HAS_CATEGORY]->(cat:Category)
@@ -384,150 +985,200 @@ class Neo4jClient:
              collect(DISTINCT cat.name) as categories,
              collect(DISTINCT pt.name) as project_types
         ORDER BY c.execution_count DESC, c.created_at DESC
-        RETURN c, tags, oses, categories, project_types
+        {_COMMAND_RETURN}
         """
 
-        with self.driver.session(database=self.database) as session:
-            result = session.run(final_query, params)
-            commands = []
-
-            for record in result:
-                node = record["c"]
-                tags = record["tags"]
-                oses = record["oses"]
-                categories = record["categories"]
-                project_types = record["project_types"]
-
-                created_at = _convert_neo4j_datetime(node["created_at"])
-                if created_at is None:
-                    continue  # Skip records with invalid timestamps
-
-                # Use first OS/category/project_type for backwards compatibility
-                # (CommandWithMetadata expects single values)
-                commands.append(
-                    CommandWithMetadata(
-                        id=node["id"],
-                        command=node["command"],
-                        description=node["description"],
-                        tags=tags,
-                        os=oses[0] if oses else None,
-                        project_type=project_types[0] if project_types else None,
-                        context=node.get("context"),
-                        category=categories[0] if categories else None,
-                        status=node.get("status"),
-                        created_at=created_at,
-                        last_used=_convert_neo4j_datetime(node.get("last_used")),
-                        use_count=node.get("use_count", 0),
-                        execution_count=node.get("execution_count", 0),
-                        success_count=node.get("success_count", 0),
-                        failure_count=node.get("failure_count", 0),
-                    )
-                )
+        try:
+            return self._run_command_query(final_query, params)
+        except Exception:
+            # Index missing or query rejected; don't retry the fulltext path
+            self._fulltext_available = False
+            return None
+
+    def _fuzzy_search_apoc(
+        self,
+        query: str,
+        threshold: int,
+        limit: int,
+        *,
+        os: str | None = None,
+        project_type: str | None = None,
+        category: str | None = None,
+        tags: list[str] | None = None,
+    ) -> list[CommandWithMetadata]:
+        """Score fuzzy matches inside Neo4j using APOC text functions.
+
+        Pushing the scoring server-side means only the top ``limit`` rows are
+        serialized over Bolt instead of every candidate. Only used when the
+        APOC plugin is available; otherwise scoring happens client-side in
+        ``_apply_fuzzy_matching``.
+        """
+        relationship_filters, tag_match, params = self._build_structural_filters(
+            os, project_type, category, tags
+        )
+        params["fuzzy_query"] = query.lower()
+        params["fuzzy_threshold"] = threshold
+        params["limit"] = limit
+
+        final_query = f"""
+        MATCH (c:Command)
+        {chr(10).join(relationship_filters)}
+        {tag_match}
+        WITH c,
+             apoc.text.levenshteinSimilarity(toLower(c.command), $fuzzy_query) AS cmd_score,
+             apoc.text.levenshteinSimilarity(toLower(c.description), $fuzzy_query) AS desc_score,
+             apoc.text.levenshteinSimilarity(
+                 toLower(coalesce(c.context, '')), $fuzzy_query) AS ctx_score
+        WITH c, apoc.coll.max([cmd_score, desc_score, ctx_score]) AS score
+        WHERE score * 100 >= $fuzzy_threshold
+        OPTIONAL MATCH (c)-[:TAGGED_WITH]->(t:Tag)
+        OPTIONAL MATCH (c)-[:RUNS_ON]->(os:OS)
+        OPTIONAL MATCH (c)-[:HAS_CATEGORY]->(cat:Category)
+        OPTIONAL MATCH (c)-[:FOR_PROJECT]->(pt:ProjectType)
+        WITH c, score,
+             collect(DISTINCT t.name) as tags,
+             collect(DISTINCT os.name) as oses,
+             collect(DISTINCT cat.name) as categories,
+             collect(DISTINCT pt.name) as project_types
+        ORDER BY score DESC, c.execution_count DESC
+        {_COMMAND_RETURN}
+        LIMIT $limit
+        """
 
-            return commands
+        return self._run_command_query(final_query, params)
 
     def _apply_fuzzy_matching(
         self, candidates: list[CommandWithMetadata], query: str, threshold: int, limit: int
     ) -> list[CommandWithMetadata]:
         """Apply fuzzy matching to candidates and return top matches.
 
-        This method scores all candidates using fuzzy string matching,
-        filters by threshold, and returns the top matches sorted by score.
+        Each candidate field list is scored with a single batched
+        ``process.extract`` call, so the query is preprocessed once per field
+        instead of once per candidate and the scoring loop stays in C. Empty
+        fields (blank descriptions, missing contexts) are dropped before
+        scoring so they never reach the scorer at all.
         """
-        scored_commands = []
-        query_lower = query.lower()
-
-        for cmd in candidates:
-            # Score against command, description, and context
-            cmd_score = fuzz.partial_ratio(query_lower, cmd.command.lower())
-            desc_score = fuzz.partial_ratio(query_lower, cmd.description.lower())
-            ctx_score = fuzz.partial_ratio(query_lower, (cmd.context or "").lower())
-            max_score = max(cmd_score, desc_score, ctx_score)
+        if not candidates:
+            return []
 
-            if max_score >= threshold:
-                scored_commands.append((max_score, cmd))
-
-        # Sort by score (highest first), then by execution count
-        scored_commands.sort(key=lambda x: (-x[0], -x[1].execution_count))
+        query_lower = query.lower()
 
-        return [cmd for _, cmd in scored_commands[:limit]]
+        # Signature prefilter: drop candidates that provably cannot reach the
+        # threshold before any string comparison happens
+        qbits = _char_signature(query_lower)
+        qlen = len(query_lower)
+        viable = [
+            (i, cmd)
+            for i, cmd in enumerate(candidates)
+            if _signature_allows(cmd, qbits, qlen, threshold)
+        ]
+
+        # Best score per candidate index across command, description and context
+        scores: dict[int, float] = {}
+
+        # Exact substring hits are guaranteed partial_ratio scores of 100,
+        # so those candidates can bypass the scorer entirely
+        for i, cmd in viable:
+            if (
+                query_lower in _lower(cmd.command)
+                or (cmd.description and query_lower in _lower(cmd.description))
+                or (cmd.context and query_lower in _lower(cmd.context))
+            ):
+                scores[i] = _PERFECT_SCORE
+
+        # All remaining fields go into one extract call so the scorer
+        # preprocesses the query exactly once. Composite keys encode
+        # (candidate, field); a perfect extract score implies an exact
+        # substring, which the fast path above already caught, so nothing is
+        # lost by not skipping between fields.
+        n_fields = len(_FUZZY_FIELDS)
+        choices: dict[int, str] = {}
+        for field_no, field in enumerate(_FUZZY_FIELDS):
+            for i, cmd in viable:
+                if i not in scores and (value := getattr(cmd, field)):
+                    choices[i * n_fields + field_no] = _lower(value)
+
+        if choices:
+            for _, score, key in process.extract(
+                query_lower,
+                choices,
+                scorer=fuzz.partial_ratio,
+                score_cutoff=threshold,
+                limit=None,
+            ):
+                index = key // n_fields
+                # Sentinel default so a best score of 0 is still recorded
+                # when the threshold is 0
+                if score > scores.get(index, -1.0):
+                    scores[index] = score
+
+        scored_commands = [(score, candidates[index]) for index, score in scores.items()]
+
+        # Heap-select the top matches by score, then execution count:
+        # O(N log K) instead of sorting every scored candidate
+        top = heapq.nlargest(limit, scored_commands, key=lambda x: (x[0], x[1].execution_count))
+
+        return [cmd for _, cmd in top]
 
     def get_command(self, command_id: str) -> CommandWithMetadata | None:
         """Get a specific command by ID."""
 
-        with self.driver.session(database=self.database) as session:
-            result = session.run(
-                """
-                MATCH (c:Command {id: $id})
-                OPTIONAL MATCH (c)-[:TAGGED_WITH]->(t:Tag)
-                OPTIONAL MATCH (c)-[:RUNS_ON]->(os:OS)
-                OPTIONAL MATCH (c)-[:HAS_CATEGORY]->(cat:Category)
-                OPTIONAL MATCH (c)-[:FOR_PROJECT]->(pt:ProjectType)
-                WITH c,
-                     collect(DISTINCT t.name) as tags,
-                     collect(DISTINCT os.name) as oses,
-                     collect(DISTINCT cat.name) as categories,
-                     collect(DISTINCT pt.name) as project_types
-                RETURN c, tags, oses, categories, project_types
-                """,
-                id=command_id,
-                now=datetime.now().astimezone().isoformat(),
-            )
+        session = self._session()
+        result = session.run(
+            f"""
+            MATCH (c:Command {{id: $id}})
+            OPTIONAL MATCH (c)-[:TAGGED_WITH]->(t:Tag)
+            OPTIONAL MATCH (c)-[:RUNS_ON]->(os:OS)
+            OPTIONAL MATCH (c)-[:HAS_CATEGORY]->(cat:Category)
+            OPTIONAL MATCH (c)-[:FOR_PROJECT]->(pt:ProjectType)
+            WITH c,
+                 collect(DISTINCT t.name) as tags,
+                 collect(DISTINCT os.name) as oses,
+                 collect(DISTINCT cat.name) as categories,
+                 collect(DISTINCT pt.name) as project_types
+            {_COMMAND_RETURN}
+            """,
+            id=command_id,
+        )
 
-            record = result.single()
-            if not record:
-                return None
-
-            node = record["c"]
-            tags = record["tags"]
-            oses = record["oses"]
-            categories = record["categories"]
-            project_types = record["project_types"]
-
-            # Validate timestamp before creating command object
-            created_at = _convert_neo4j_datetime(node["created_at"])
-            if created_at is None:
-                return None  # Invalid timestamp
-
-            # Command is already obfuscated in DB, just return it
-            return CommandWithMetadata(
-                id=node["id"],
-                command=node["command"],
-                description=node["description"],
-                tags=tags,
-                os=oses[0] if oses else None,
-                project_type=project_types[0] if project_types else None,
-                context=node.get("context"),
-                category=categories[0] if categories else None,
-                status=node.get("status"),
-                created_at=created_at,
-                last_used=_convert_neo4j_datetime(node.get("last_used")),
-                use_count=node.get("use_count", 0),
-                execution_count=node.get("execution_count", 0),
-                success_count=node.get("success_count", 0),
-                failure_count=node.get("failure_count", 0),
-            )
+        record = result.single()
+        if not record:
+            return None
+
+        # Command is already obfuscated in DB, just return it.
+        # Hydration returns None for invalid timestamps.
+        return _record_to_command(record)
 
     def delete_command(self, command_id: str) -> bool:
         """Delete a command from the database."""
+        self._search_cache.clear()
+        # Tag/Category nodes may be cleaned up externally once orphaned, so
+        # refetch rather than guessing which entries are still live
+        self._tag_cache = None
+        self._category_cache = None
+
+        session = self._session()
+        result = session.run(
+            """
+            MATCH (c:Command {id: $id})
+            DETACH DELETE c
+            RETURN count(c) as deleted
+            """,
+            id=command_id,
+        )
 
-        with self.driver.session(database=self.database) as session:
-            result = session.run(
-                """
-                MATCH (c:Command {id: $id})
-                DETACH DELETE c
-                RETURN count(c) as deleted
-                """,
-                id=command_id,
-            )
-
-            record = result.single()
-            return record["deleted"] > 0 if record else False
+        record = result.single()
+        return record["deleted"] > 0 if record else False
 
     def get_all_tags(self) -> list[str]:
-        """Get all unique tags in the database."""
+        """Get all unique tags in the database.
 
-        with self.driver.session(database=self.database) as session:
+        The tag set is cached in-process after the first call and kept in
+        sync by the write paths, so autocomplete-style repeated calls avoid
+        a round-trip.
+        """
+        if self._tag_cache is None:
+            session = self._session()
             result = session.run(
                 """
                 MATCH (t:Tag)
@@ -535,13 +1186,17 @@ class Neo4jClient:
                 ORDER BY tag
                 """
             )
+            self._tag_cache = {record["tag"] for record in result}
 
-            return [record["tag"] for record in result]
+        return sorted(self._tag_cache)
 
     def get_all_categories(self) -> list[str]:
-        """Get all unique categories in the database."""
+        """Get all unique categories in the database.
 
-        with self.driver.session(database=self.database) as session:
+        Cached in-process the same way as get_all_tags.
+        """
+        if self._category_cache is None:
+            session = self._session()
             result = session.run(
                 """
                 MATCH (cat:Category)
@@ -549,5 +1204,6 @@ class Neo4jClient:
                 ORDER BY category
                 """
             )
+            self._category_cache = {record["category"] for record in result}
 
-            return [record["category"] for record in result]
+        return sorted(self._category_cache)
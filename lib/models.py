@@ -30,3 +30,8 @@ class CommandWithMetadata(Command):
     execution_count: int = Field(0, description="Total number of times this command was executed")
     success_count: int = Field(0, description="Number of successful executions")
     failure_count: int = Field(0, description="Number of failed executions")
+    sigbits: int | None = Field(
+        None,
+        exclude=True,
+        description="Character-presence bitmap used internally to prefilter fuzzy matching",
+    )
@@ -0,0 +1,113 @@
+"""Shared fixtures for integration tests.
+
+The Neo4j container is session-scoped so its JVM boots once per pytest
+process instead of once per test module. Under pytest-xdist each worker
+process runs its own session, so every worker gets an isolated container
+and tests from different modules never share state across workers when
+run with --dist loadscope.
+"""
+
+import os
+from collections.abc import Generator
+
+import pytest
+from neo4j import Driver, GraphDatabase
+from testcontainers.core.docker_client import DockerClient
+from testcontainers.neo4j import Neo4jContainer
+
+from lib.database import Neo4jClient
+from lib.settings import Settings
+
+_REUSE_CONTAINER_PREFIX = "mem-box-test-neo4j"
+
+
+def _reuse_container_name() -> str:
+    """Name of the reusable container for this process.
+
+    Each xdist worker runs its own session-scoped fixture, so the name
+    carries the worker id; otherwise a cold start would have every
+    worker race to create the same named container and all but the
+    winner would die on a Docker name conflict.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    return f"{_REUSE_CONTAINER_PREFIX}-{worker}" if worker else _REUSE_CONTAINER_PREFIX
+
+
+SKIP_INTEGRATION = os.getenv("SKIP_INTEGRATION_TESTS", "false").lower() == "true"
+
+# server.server builds a MemoryBox at import time, which needs a live
+# database, so the module cannot even be collected when integration is off
+collect_ignore = ["test_server_integration.py"] if SKIP_INTEGRATION else []
+
+
+@pytest.fixture(scope="session")
+def neo4j_container() -> Generator[Neo4jContainer, None, None]:
+    """Start a Neo4j container for testing.
+
+    Setting TC_REUSE keeps the container alive between local runs, so
+    repeated invocations skip the Neo4j JVM boot. testcontainers-python
+    has no built-in reuse mode, so the fixture names the container and
+    re-attaches when it is still running; pair TC_REUSE with
+    TESTCONTAINERS_RYUK_DISABLED=true so the reaper does not remove it
+    after the run. The name is suffixed with the xdist worker id so
+    parallel workers keep one container each instead of racing to
+    create the same name. Fixture teardowns already leave the database
+    empty, so a reused container is safe to start from.
+    """
+    container = Neo4jContainer("neo4j:5-community")
+    if not os.getenv("TC_REUSE"):
+        with container as started:
+            yield started
+        return
+
+    name = _reuse_container_name()
+    # Docker's name filter is a substring match, so compare exactly to
+    # avoid attaching to another worker's suffixed container
+    candidates = DockerClient().client.containers.list(filters={"name": name, "status": "running"})
+    running = [c for c in candidates if c.name == name]
+    if running:
+        container._container = running[0]
+    else:
+        container.with_name(name).start()
+    # Intentionally not stopped: the next run re-attaches to it
+    yield container
+
+
+@pytest.fixture(scope="session")
+def neo4j_settings(neo4j_container: Neo4jContainer) -> Settings:
+    """Create settings for Neo4j test database."""
+    return Settings(
+        neo4j_uri=neo4j_container.get_connection_url(),
+        neo4j_user=neo4j_container.username,
+        neo4j_password=neo4j_container.password,
+        neo4j_database="neo4j",
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_driver(neo4j_settings: Settings) -> Generator[Driver, None, None]:
+    """Session-wide Neo4j driver whose Bolt connection pool is shared.
+
+    Per-test clients are constructed with this driver injected, so tests
+    reuse warm pooled connections instead of paying a TCP handshake and
+    Bolt HELLO for every freshly-built driver.
+    """
+    driver = GraphDatabase.driver(
+        neo4j_settings.neo4j_uri,
+        auth=(neo4j_settings.neo4j_user, neo4j_settings.neo4j_password),
+        max_connection_pool_size=20,
+    )
+    yield driver
+    driver.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _init_schema(neo4j_settings: Settings, shared_driver: Driver) -> None:
+    """Create constraints and indexes once for the whole session.
+
+    Per-test clients are built with initialize_schema=False, so they skip
+    the idempotent-but-not-free DDL round-trips on every construction.
+    """
+    client = Neo4jClient(neo4j_settings, driver=shared_driver, initialize_schema=False)
+    client.ensure_schema()
+    client.close()
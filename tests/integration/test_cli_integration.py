@@ -1,48 +1,48 @@
 """Integration tests for CLI with real Neo4j database."""
 
+import os
 from collections.abc import Generator
 
 import pytest
-from testcontainers.neo4j import Neo4jContainer
+from neo4j import Driver
 from typer.testing import CliRunner
 
 from lib.database import Neo4jClient
 from lib.settings import Settings
 from server.cli import app
 
+pytestmark = pytest.mark.skipif(
+    os.getenv("SKIP_INTEGRATION_TESTS", "false").lower() == "true",
+    reason="integration tests disabled via SKIP_INTEGRATION_TESTS",
+)
 
-@pytest.fixture(scope="module")
-def neo4j_container() -> Generator[Neo4jContainer, None, None]:
-    """Start a Neo4j container for testing."""
-    with Neo4jContainer("neo4j:5-community") as container:
-        yield container
-
-
-@pytest.fixture(scope="module")
-def neo4j_settings(neo4j_container: Neo4jContainer) -> Settings:
-    """Create settings for Neo4j test database."""
-    return Settings(
-        neo4j_uri=neo4j_container.get_connection_url(),
-        neo4j_user=neo4j_container.username,
-        neo4j_password=neo4j_container.password,
-        neo4j_database="neo4j",
-    )
+# Single constant so the server caches one query plan across teardowns.
+# CALL IN TRANSACTIONS must run in an auto-commit session, so this cannot
+# go through execute_write's managed transactions.
+_CLEANUP_CYPHER = "MATCH (n) CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 5000 ROWS"
 
 
 @pytest.fixture
-def neo4j_client(neo4j_settings: Settings) -> Generator[Neo4jClient, None, None]:
-    """Create a Neo4j client for integration tests."""
-    client = Neo4jClient(neo4j_settings)
+def neo4j_client(
+    neo4j_settings: Settings, shared_driver: Driver
+) -> Generator[Neo4jClient, None, None]:
+    """Create a Neo4j client for integration tests.
+
+    The CLI under test spawns its own client and commits its writes, so
+    this fixture cleans with a delete sweep rather than the rollback
+    isolation used by the other integration modules.
+    """
+    client = Neo4jClient(neo4j_settings, driver=shared_driver, initialize_schema=False)
 
     # Clean before test
     with client.driver.session(database=client.database) as session:
-        session.run("MATCH (n) DETACH DELETE n")
+        session.run(_CLEANUP_CYPHER)
 
     yield client
 
     # Clean after test
     with client.driver.session(database=client.database) as session:
-        session.run("MATCH (n) DETACH DELETE n")
+        session.run(_CLEANUP_CYPHER)
 
     client.close()
 
@@ -1,50 +1,38 @@
 """Integration tests for Neo4j database."""
 
+import os
 import uuid
 from collections.abc import Generator
 from datetime import UTC, datetime
 
 import pytest
-from testcontainers.neo4j import Neo4jContainer
+from neo4j import Driver
 
 import lib.config
 from lib.database import Neo4jClient
 from lib.models import Command, CommandWithMetadata
 from lib.settings import Settings
 
-
-@pytest.fixture(scope="module")
-def neo4j_container() -> Generator[Neo4jContainer, None, None]:
-    """Start a Neo4j container for testing."""
-    with Neo4jContainer("neo4j:5-community") as container:
-        yield container
-
-
-@pytest.fixture(scope="module")
-def neo4j_settings(neo4j_container: Neo4jContainer) -> Settings:
-    """Create settings for Neo4j test database."""
-    return Settings(
-        neo4j_uri=neo4j_container.get_connection_url(),
-        neo4j_user=neo4j_container.username,
-        neo4j_password=neo4j_container.password,
-        neo4j_database="neo4j",
-    )
+pytestmark = pytest.mark.skipif(
+    os.getenv("SKIP_INTEGRATION_TESTS", "false").lower() == "true",
+    reason="integration tests disabled via SKIP_INTEGRATION_TESTS",
+)
 
 
 @pytest.fixture
-def db_client(neo4j_settings: Settings) -> Generator[Neo4jClient, None, None]:
-    """Create a database client and clean up after tests."""
-    client = Neo4jClient(neo4j_settings)
-    yield client
+def db_client(
+    neo4j_settings: Settings, shared_driver: Driver
+) -> Generator[Neo4jClient, None, None]:
+    """Create a database client whose writes are rolled back after the test."""
+    client = Neo4jClient(neo4j_settings, driver=shared_driver, initialize_schema=False)
+    tx_session = shared_driver.session(database=client.database)
+    tx = tx_session.begin_transaction()
+    client._override_tx(tx)
 
-    # Cleanup: Delete all test data
-    with client.driver.session(database=client.database) as session:
-        session.run("MATCH (n:Command) DETACH DELETE n")
-        session.run("MATCH (n:Tag) DELETE n")
-        session.run("MATCH (n:Category) DELETE n")
-        session.run("MATCH (n:OS) DELETE n")
-        session.run("MATCH (n:ProjectType) DELETE n")
+    yield client
 
+    tx.rollback()
+    tx_session.close()
     client.close()
 
 
@@ -103,8 +91,7 @@ class TestNeo4jIntegration:
             ),
         ]
 
-        for cmd in commands:
-            db_client.add_command(cmd)
+        db_client.add_commands(commands)
 
         # Search for docker commands
         results = db_client.search_commands(query="docker", limit=10)
@@ -146,8 +133,7 @@ class TestNeo4jIntegration:
             ),
         ]
 
-        for cmd in commands:
-            db_client.add_command(cmd)
+        db_client.add_commands(commands)
 
         # Filter by OS
         linux_results = db_client.search_commands(os="linux", limit=10)
@@ -236,8 +222,7 @@ class TestNeo4jIntegration:
             Command(command="cmd3", description="Command 3", tags=["tag3", "tag4"]),
         ]
 
-        for cmd in commands:
-            db_client.add_command(cmd)
+        db_client.add_commands(commands)
 
         tags = db_client.get_all_tags()
         assert len(tags) >= 4
@@ -252,8 +237,7 @@ class TestNeo4jIntegration:
             Command(command="unique_cmd3", description="Command 3", category="cat2"),
         ]
 
-        for cmd in commands:
-            db_client.add_command(cmd)
+        db_client.add_commands(commands)
 
         categories = db_client.get_all_categories()
         assert len(categories) >= 2
@@ -284,15 +268,18 @@ class TestNeo4jIntegration:
 
     def test_search_with_limit(self, db_client: Neo4jClient) -> None:
         """Test that search respects limit parameter."""
-        # Add many commands
-        for i in range(10):
-            cmd = Command(
-                command=f"test command {i}",
-                description=f"Test command number {i}",
-                tags=["test"],
-                category="test",
-            )
-            db_client.add_command(cmd)
+        # Add many commands in one batch
+        db_client.add_commands(
+            [
+                Command(
+                    command=f"test command {i}",
+                    description=f"Test command number {i}",
+                    tags=["test"],
+                    category="test",
+                )
+                for i in range(10)
+            ]
+        )
 
         # Search with limit
         results = db_client.search_commands(category="test", limit=5)
@@ -1,47 +1,35 @@
 """Integration tests for fuzzy search functionality."""
 
+import os
 from collections.abc import Generator
 
 import pytest
-from testcontainers.neo4j import Neo4jContainer
+from neo4j import Driver
 
 from lib.database import Neo4jClient
 from lib.models import Command
 from lib.settings import Settings
 
-
-@pytest.fixture(scope="module")
-def neo4j_container() -> Generator[Neo4jContainer, None, None]:
-    """Start a Neo4j container for testing."""
-    with Neo4jContainer("neo4j:5-community") as container:
-        yield container
-
-
-@pytest.fixture(scope="module")
-def neo4j_settings(neo4j_container: Neo4jContainer) -> Settings:
-    """Create settings for Neo4j test database."""
-    return Settings(
-        neo4j_uri=neo4j_container.get_connection_url(),
-        neo4j_user=neo4j_container.username,
-        neo4j_password=neo4j_container.password,
-        neo4j_database="neo4j",
-    )
+pytestmark = pytest.mark.skipif(
+    os.getenv("SKIP_INTEGRATION_TESTS", "false").lower() == "true",
+    reason="integration tests disabled via SKIP_INTEGRATION_TESTS",
+)
 
 
 @pytest.fixture
-def db_client(neo4j_settings: Settings) -> Generator[Neo4jClient, None, None]:
-    """Create a database client and clean up after tests."""
-    client = Neo4jClient(neo4j_settings)
-    yield client
+def db_client(
+    neo4j_settings: Settings, shared_driver: Driver
+) -> Generator[Neo4jClient, None, None]:
+    """Create a database client whose writes are rolled back after the test."""
+    client = Neo4jClient(neo4j_settings, driver=shared_driver, initialize_schema=False)
+    tx_session = shared_driver.session(database=client.database)
+    tx = tx_session.begin_transaction()
+    client._override_tx(tx)
 
-    # Cleanup: Delete all test data
-    with client.driver.session(database=client.database) as session:
-        session.run("MATCH (n:Command) DETACH DELETE n")
-        session.run("MATCH (n:Tag) DELETE n")
-        session.run("MATCH (n:Category) DELETE n")
-        session.run("MATCH (n:OS) DELETE n")
-        session.run("MATCH (n:ProjectType) DELETE n")
+    yield client
 
+    tx.rollback()
+    tx_session.close()
     client.close()
 
 
@@ -475,14 +463,17 @@ class TestFuzzySearchIntegration:
 
     def test_fuzzy_search_limit_respected(self, db_client: Neo4jClient) -> None:
         """Test that fuzzy search respects the limit parameter."""
-        # Add multiple similar commands
-        for i in range(10):
-            cmd = Command(
-                command=f"docker container ls {i}",
-                description=f"List docker containers {i}",
-                tags=["docker"],
-            )
-            db_client.add_command(cmd)
+        # Add multiple similar commands in one batch
+        db_client.add_commands(
+            [
+                Command(
+                    command=f"docker container ls {i}",
+                    description=f"List docker containers {i}",
+                    tags=["docker"],
+                )
+                for i in range(10)
+            ]
+        )
 
         # Search with limit
         results = db_client.search_commands(query="doker", fuzzy=True, fuzzy_threshold=60, limit=3)
@@ -640,8 +631,7 @@ class TestFuzzySearchIntegration:
             Command(command="kubectl create", description="Create k8s resource", tags=["k8s"]),
         ]
 
-        for cmd in commands:
-            db_client.add_command(cmd)
+        db_client.add_commands(commands)
 
         # Search for "npm" - shouldn't match any of these
         results = db_client.search_commands(query="npm install", fuzzy=True, fuzzy_threshold=60)
@@ -669,8 +659,7 @@ class TestFuzzySearchIntegration:
             Command(command="ruby script.rb", description="Run Ruby", tags=["ruby"]),
         ]
 
-        for cmd in commands:
-            db_client.add_command(cmd)
+        db_client.add_commands(commands)
 
         # Search for Java - shouldn't match these
         results = db_client.search_commands(query="java", fuzzy=True, fuzzy_threshold=65)
@@ -759,10 +748,11 @@ class TestFuzzySearchIntegration:
         id2 = db_client.add_command(cmd2)
         id3 = db_client.add_command(cmd3)
 
-        # Manually set execution_count in database for testing
-        with db_client.driver.session(database=db_client.database) as session:
-            session.run("MATCH (c:Command {id: $id}) SET c.execution_count = 5", id=id2)
-            session.run("MATCH (c:Command {id: $id}) SET c.execution_count = 10", id=id3)
+        # Manually set execution_count through the overridden transaction;
+        # a separate session could not see the uncommitted Command nodes
+        session = db_client._session()
+        session.run("MATCH (c:Command {id: $id}) SET c.execution_count = 5", id=id2)
+        session.run("MATCH (c:Command {id: $id}) SET c.execution_count = 10", id=id3)
 
         # Search with fuzzy - all should have similar scores
         results = db_client.search_commands(query="docker ps", fuzzy=True, fuzzy_threshold=60)
@@ -795,9 +785,8 @@ class TestFuzzySearchIntegration:
         db_client.add_command(cmd1)
         id2 = db_client.add_command(cmd2)
 
-        # Set execution_count for cmd2
-        with db_client.driver.session(database=db_client.database) as session:
-            session.run("MATCH (c:Command {id: $id}) SET c.execution_count = 8", id=id2)
+        # Set execution_count for cmd2 through the overridden transaction
+        db_client._session().run("MATCH (c:Command {id: $id}) SET c.execution_count = 8", id=id2)
 
         # Search - both will have similar fuzzy scores for "kubectl"
         results = db_client.search_commands(query="kubectl", fuzzy=True, fuzzy_threshold=50)
@@ -819,10 +808,11 @@ class TestFuzzySearchIntegration:
         id2 = db_client.add_command(cmd2)
         id3 = db_client.add_command(cmd3)
 
-        # Set execution_count: cmd2 most popular, cmd3 second
-        with db_client.driver.session(database=db_client.database) as session:
-            session.run("MATCH (c:Command {id: $id}) SET c.execution_count = 15", id=id2)
-            session.run("MATCH (c:Command {id: $id}) SET c.execution_count = 7", id=id3)
+        # Set execution_count through the overridden transaction:
+        # cmd2 most popular, cmd3 second
+        session = db_client._session()
+        session.run("MATCH (c:Command {id: $id}) SET c.execution_count = 15", id=id2)
+        session.run("MATCH (c:Command {id: $id}) SET c.execution_count = 7", id=id3)
 
         # Exact search for "git"
         results = db_client.search_commands(query="git", fuzzy=False)
@@ -1,44 +1,35 @@
 """Integration tests for secret obfuscation in database operations."""
 
+import os
 from collections.abc import Generator
 
 import pytest
-from testcontainers.neo4j import Neo4jContainer
+from neo4j import Driver
 
 from lib.database import Neo4jClient
 from lib.models import Command
 from lib.settings import Settings
 
-
-@pytest.fixture(scope="module")
-def neo4j_container() -> Generator[Neo4jContainer, None, None]:
-    """Start a Neo4j container for testing."""
-    with Neo4jContainer("neo4j:5-community") as container:
-        yield container
-
-
-@pytest.fixture(scope="module")
-def neo4j_settings(neo4j_container: Neo4jContainer) -> Settings:
-    """Create settings for Neo4j test database."""
-    return Settings(
-        neo4j_uri=neo4j_container.get_connection_url(),
-        neo4j_user=neo4j_container.username,
-        neo4j_password=neo4j_container.password,
-        neo4j_database="neo4j",
-    )
+pytestmark = pytest.mark.skipif(
+    os.getenv("SKIP_INTEGRATION_TESTS", "false").lower() == "true",
+    reason="integration tests disabled via SKIP_INTEGRATION_TESTS",
+)
 
 
 @pytest.fixture
-def db_client(neo4j_settings: Settings) -> Generator[Neo4jClient, None, None]:
-    """Create a database client and clean up after tests."""
-    client = Neo4jClient(neo4j_settings)
-    yield client
+def db_client(
+    neo4j_settings: Settings, shared_driver: Driver
+) -> Generator[Neo4jClient, None, None]:
+    """Create a database client whose writes are rolled back after the test."""
+    client = Neo4jClient(neo4j_settings, driver=shared_driver, initialize_schema=False)
+    tx_session = shared_driver.session(database=client.database)
+    tx = tx_session.begin_transaction()
+    client._override_tx(tx)
 
-    # Cleanup: Delete all test data
-    with client.driver.session(database=client.database) as session:
-        session.run("MATCH (n:Command) DETACH DELETE n")
-        session.run("MATCH (n:Tag) DELETE n")
+    yield client
 
+    tx.rollback()
+    tx_session.close()
     client.close()
 
 
@@ -1,13 +1,15 @@
 """Integration tests for MCP server with test Neo4j container."""
 
-from collections.abc import Generator
+import os
+from collections.abc import Callable, Generator
 
 import pytest
-from testcontainers.neo4j import Neo4jContainer
+from neo4j import Driver
 
 import server.server
 from lib.api import MemoryBox
 from lib.database import Neo4jClient
+from lib.models import Command
 from lib.settings import Settings
 from server.server import (
     add_command,
@@ -19,40 +21,32 @@ from server.server import (
     search_commands,
 )
 
-
-@pytest.fixture(scope="module")
-def neo4j_container() -> Generator[Neo4jContainer, None, None]:
-    """Start a Neo4j container for testing."""
-    with Neo4jContainer("neo4j:5-community") as container:
-        yield container
-
-
-@pytest.fixture(scope="module")
-def neo4j_settings(neo4j_container: Neo4jContainer) -> Settings:
-    """Create settings for Neo4j test database."""
-    return Settings(
-        neo4j_uri=neo4j_container.get_connection_url(),
-        neo4j_user=neo4j_container.username,
-        neo4j_password=neo4j_container.password,
-        neo4j_database="neo4j",
-    )
+pytestmark = pytest.mark.skipif(
+    os.getenv("SKIP_INTEGRATION_TESTS", "false").lower() == "true",
+    reason="integration tests disabled via SKIP_INTEGRATION_TESTS",
+)
 
 
 @pytest.fixture
-def test_memory_box(neo4j_settings: Settings) -> Generator[MemoryBox, None, None]:
-    """Create a MemoryBox instance using test container settings."""
-    mb = MemoryBox(settings=neo4j_settings)
+def test_memory_box(
+    neo4j_settings: Settings, shared_driver: Driver
+) -> Generator[MemoryBox, None, None]:
+    """Create a MemoryBox whose writes are rolled back after the test.
 
-    # Clean before test
-    with mb._client.driver.session(database=mb._client.database) as session:
-        session.run("MATCH (n) DETACH DELETE n")
+    All queries are routed through a single explicit transaction that is
+    never committed, so each test sees an empty graph without paying for a
+    full MATCH (n) DETACH DELETE n sweep before and after every test.
+    """
+    mb = MemoryBox(settings=neo4j_settings, driver=shared_driver, initialize_schema=False)
 
-    yield mb
+    tx_session = shared_driver.session(database=mb._client.database)
+    tx = tx_session.begin_transaction()
+    mb._client._override_tx(tx)
 
-    # Clean after test
-    with mb._client.driver.session(database=mb._client.database) as session:
-        session.run("MATCH (n) DETACH DELETE n")
+    yield mb
 
+    tx.rollback()
+    tx_session.close()
     mb.close()
 
 
@@ -62,6 +56,21 @@ def neo4j_client(test_memory_box: MemoryBox) -> Neo4jClient:
     return test_memory_box._client
 
 
+@pytest.fixture
+def mcp_seed(test_memory_box: MemoryBox) -> Callable[[list[Command]], None]:
+    """Seed commands through the batched API.
+
+    Setup blocks don't need MCP-tool dispatch or response formatting, so
+    seeding goes straight to MemoryBox.add_commands in a single write;
+    add_command.fn stays in the tests that assert on its output.
+    """
+
+    def _seed(commands: list[Command]) -> None:
+        test_memory_box.add_commands(commands)
+
+    return _seed
+
+
 @pytest.fixture(autouse=True)
 def patch_server_memory_box(test_memory_box: MemoryBox):
     """Patch the global memory_box in server.server to use test container."""
@@ -92,25 +101,17 @@ class TestMCPServerIntegration:
         assert any("git push origin main" in cmd["command"] for cmd in search_result)
         assert any("Push changes to main branch" in cmd["description"] for cmd in search_result)
 
-    def test_add_get_and_delete_command(self, neo4j_client):
+    def test_add_get_and_delete_command(self, test_memory_box):
         """Test the full lifecycle via MCP: add, get, delete."""
-        # Add a command
-        add_result = add_command.fn(
-            command="kubectl get pods",
-            description="List all pods",
-            tags=["kubernetes", "kubectl"],
-            auto_detect_context=False,
+        # Add a command through the structured API; the MCP formatting path
+        # is covered by test_add_and_search_command
+        command_id = test_memory_box.add_command(
+            Command(
+                command="kubectl get pods",
+                description="List all pods",
+                tags=["kubernetes", "kubectl"],
+            )
         )
-        assert "Command added successfully" in add_result
-
-        # Extract command ID from result
-        lines = add_result.split("\n")
-        command_id = None
-        for line in lines:
-            if "ID:" in line:
-                command_id = line.split("ID:")[-1].strip()
-                break
-
         assert command_id is not None
 
         # Get the command
@@ -136,22 +137,24 @@ class TestMCPServerIntegration:
         )
         assert "Command added successfully" in result
 
-    def test_search_with_filters(self, neo4j_client):
+    def test_search_with_filters(self, mcp_seed):
         """Test searching with various filters via MCP."""
         # Add commands with different attributes
-        add_command.fn(
-            command="ls -la",
-            description="List files detailed",
-            tags=["filesystem"],
-            category="navigation",
-            auto_detect_context=False,
-        )
-        add_command.fn(
-            command="grep -r 'pattern' .",
-            description="Search for pattern",
-            tags=["filesystem", "search"],
-            category="search",
-            auto_detect_context=False,
+        mcp_seed(
+            [
+                Command(
+                    command="ls -la",
+                    description="List files detailed",
+                    tags=["filesystem"],
+                    category="navigation",
+                ),
+                Command(
+                    command="grep -r 'pattern' .",
+                    description="Search for pattern",
+                    tags=["filesystem", "search"],
+                    category="search",
+                ),
+            ]
         )
 
         # Search by tags
@@ -173,20 +176,22 @@ class TestMCPServerIntegration:
         # Also matches because it has "filesystem" tag
         assert any("ls -la" in cmd["command"] for cmd in result)
 
-    def test_list_tags(self, neo4j_client):
+    def test_list_tags(self, mcp_seed):
         """Test listing all tags via MCP."""
         # Add commands with tags
-        add_command.fn(
-            command="npm test",
-            description="Run npm tests",
-            tags=["npm", "testing", "nodejs"],
-            auto_detect_context=False,
-        )
-        add_command.fn(
-            command="pip install -r requirements.txt",
-            description="Install Python packages",
-            tags=["python", "pip"],
-            auto_detect_context=False,
+        mcp_seed(
+            [
+                Command(
+                    command="npm test",
+                    description="Run npm tests",
+                    tags=["npm", "testing", "nodejs"],
+                ),
+                Command(
+                    command="pip install -r requirements.txt",
+                    description="Install Python packages",
+                    tags=["python", "pip"],
+                ),
+            ]
         )
 
         # List tags
@@ -197,20 +202,22 @@ class TestMCPServerIntegration:
         assert "python" in result
         assert "pip" in result
 
-    def test_list_categories(self, neo4j_client):
+    def test_list_categories(self, mcp_seed):
         """Test listing all categories via MCP."""
         # Add commands with categories
-        add_command.fn(
-            command="docker-compose up",
-            description="Start containers",
-            category="docker",
-            auto_detect_context=False,
-        )
-        add_command.fn(
-            command="systemctl restart nginx",
-            description="Restart nginx service",
-            category="system",
-            auto_detect_context=False,
+        mcp_seed(
+            [
+                Command(
+                    command="docker-compose up",
+                    description="Start containers",
+                    category="docker",
+                ),
+                Command(
+                    command="systemctl restart nginx",
+                    description="Restart nginx service",
+                    category="system",
+                ),
+            ]
         )
 
         # List categories
@@ -218,20 +225,18 @@ class TestMCPServerIntegration:
         assert "docker" in result
         assert "system" in result
 
-    def test_get_context_suggestions(self, neo4j_client):
+    def test_get_context_suggestions(self, mcp_seed):
         """Test getting context-based suggestions via MCP."""
         # Add commands with specific OS context
-        add_command.fn(
-            command="apt install vim",
-            description="Install vim editor",
-            os="linux",
-            auto_detect_context=False,
-        )
-        add_command.fn(
-            command="brew install vim",
-            description="Install vim with Homebrew",
-            os="macos",
-            auto_detect_context=False,
+        mcp_seed(
+            [
+                Command(command="apt install vim", description="Install vim editor", os="linux"),
+                Command(
+                    command="brew install vim",
+                    description="Install vim with Homebrew",
+                    os="macos",
+                ),
+            ]
         )
 
         # Get suggestions (will use current context)
@@ -239,95 +244,62 @@ class TestMCPServerIntegration:
         # Should return suggestions based on current OS
         assert "command" in result.lower() or "no commands found" in result.lower()
 
-    def test_search_with_os_filter(self, neo4j_client):
-        """Test searching with OS filter via MCP."""
-        # Add commands for different OS
-        add_command.fn(
-            command="apt update",
-            description="Update packages",
-            os="linux",
-            auto_detect_context=False,
-        )
-        add_command.fn(
-            command="brew update",
-            description="Update Homebrew",
-            os="macos",
-            auto_detect_context=False,
-        )
-
-        # Search for Linux commands
-        result = search_commands.fn(os="linux")
-        assert isinstance(result, list)
-        assert any("apt update" in cmd["command"] for cmd in result)
-        assert not any("brew update" in cmd["command"] for cmd in result)
-
-        # Search for macOS commands
-        result = search_commands.fn(os="macos")
-        assert isinstance(result, list)
-        assert any("brew update" in cmd["command"] for cmd in result)
-        assert not any("apt update" in cmd["command"] for cmd in result)
-
-    def test_search_with_project_type_filter(self, neo4j_client):
-        """Test searching with project type filter via MCP."""
-        # Add commands for different project types
-        add_command.fn(
-            command="npm run build",
-            description="Build Node.js project",
-            project_type="nodejs",
-            auto_detect_context=False,
-        )
-        add_command.fn(
-            command="cargo build --release",
-            description="Build Rust project",
-            project_type="rust",
-            auto_detect_context=False,
+    @pytest.mark.parametrize(
+        ("field", "first", "second"),
+        [
+            ("os", ("apt update", "linux"), ("brew update", "macos")),
+            ("project_type", ("npm run build", "nodejs"), ("cargo build --release", "rust")),
+        ],
+    )
+    def test_search_with_attribute_filter(self, mcp_seed, field, first, second):
+        """Test searching with single-attribute filters via MCP."""
+        # Seed two commands differing only in the filtered attribute
+        mcp_seed(
+            [
+                Command(command=first[0], description="Test command", **{field: first[1]}),
+                Command(command=second[0], description="Test command", **{field: second[1]}),
+            ]
         )
 
-        # Search for Node.js commands
-        result = search_commands.fn(project_type="nodejs")
-        assert isinstance(result, list)
-        assert any("npm run build" in cmd["command"] for cmd in result)
-        assert not any("cargo build" in cmd["command"] for cmd in result)
-
-        # Search for Rust commands
-        result = search_commands.fn(project_type="rust")
-        assert isinstance(result, list)
-        assert any("cargo build" in cmd["command"] for cmd in result)
-        assert not any("npm run build" in cmd["command"] for cmd in result)
+        # Each filter value must return its own command and not the other's
+        for (matching, value), (other, _) in ((first, second), (second, first)):
+            result = search_commands.fn(**{field: value})
+            assert isinstance(result, list)
+            assert any(matching in cmd["command"] for cmd in result)
+            assert not any(other in cmd["command"] for cmd in result)
 
-    def test_search_with_limit(self, neo4j_client):
+    def test_search_with_limit(self, mcp_seed):
         """Test search with limit parameter via MCP."""
-        # Add multiple commands
-        for i in range(10):
-            add_command.fn(
-                command=f"echo 'test {i}'",
-                description=f"Test command {i}",
-                tags=["test"],
-                auto_detect_context=False,
-            )
+        # Add multiple commands in one batch
+        mcp_seed(
+            [
+                Command(
+                    command=f"echo 'test {i}'",
+                    description=f"Test command {i}",
+                    tags=["test"],
+                )
+                for i in range(10)
+            ]
+        )
 
         # Search with limit
         result = search_commands.fn(tags=["test"], limit=3)
         # Should contain at most 3 commands
-        assert result.count("echo 'test") <= 3
+        assert isinstance(result, list)
+        assert 0 < len(result) <= 3
+        assert all("echo 'test" in cmd["command"] for cmd in result)
 
-    def test_execution_count_not_incremented_by_retrieval(self, neo4j_client):
+    def test_execution_count_not_incremented_by_retrieval(self, test_memory_box):
         """Test that retrieving a command does NOT increment execution count via MCP."""
-        # Add a command
-        add_result = add_command.fn(
-            command="systemctl status",
-            description="Check service status",
-            auto_detect_context=False,
+        # Add a command through the structured API instead of scraping the ID
+        # out of the MCP tool's prose response
+        command_id = test_memory_box.add_command(
+            Command(
+                command="systemctl status",
+                description="Check service status",
+            )
         )
 
-        # Extract command ID
-        lines = add_result.split("\n")
-        command_id = None
-        for line in lines:
-            if "ID:" in line:
-                command_id = line.split("ID:")[-1].strip()
-                break
-
         # Get the command multiple times - should NOT increment execution_count
         for _ in range(3):
             get_command_by_id.fn(command_id=command_id)
@@ -356,29 +328,30 @@ class TestMCPServerIntegration:
         assert any("docker build" in cmd["command"] for cmd in search_result)
         assert any("Build Docker image" in cmd["description"] for cmd in search_result)
 
-    def test_search_with_query_and_filters(self, neo4j_client):
+    def test_search_with_query_and_filters(self, mcp_seed):
         """Test combining query search with filters via MCP."""
         # Add various commands
-        add_command.fn(
-            command="git commit -m 'fix'",
-            description="Commit bug fix",
-            tags=["git"],
-            category="version-control",
-            auto_detect_context=False,
-        )
-        add_command.fn(
-            command="git push origin develop",
-            description="Push to develop branch",
-            tags=["git"],
-            category="version-control",
-            auto_detect_context=False,
-        )
-        add_command.fn(
-            command="svn commit -m 'fix'",
-            description="Commit with SVN",
-            tags=["svn"],
-            category="version-control",
-            auto_detect_context=False,
+        mcp_seed(
+            [
+                Command(
+                    command="git commit -m 'fix'",
+                    description="Commit bug fix",
+                    tags=["git"],
+                    category="version-control",
+                ),
+                Command(
+                    command="git push origin develop",
+                    description="Push to develop branch",
+                    tags=["git"],
+                    category="version-control",
+                ),
+                Command(
+                    command="svn commit -m 'fix'",
+                    description="Commit with SVN",
+                    tags=["svn"],
+                    category="version-control",
+                ),
+            ]
         )
 
         # Search with both query and filters
@@ -106,6 +106,24 @@ def test_add_command_with_all_parameters():
         assert call_args.category == "package-management"
 
 
+def test_add_commands_batch():
+    """Test adding multiple commands in one batch."""
+    with patch("lib.api.Neo4jClient") as mock_client:
+        mock_instance = MagicMock()
+        mock_instance.add_commands.return_value = ["id-1", "id-2"]
+        mock_client.return_value = mock_instance
+
+        mb = MemoryBox()
+        commands = [
+            Command(command="git status", description="Check status"),
+            Command(command="docker ps", description="List containers"),
+        ]
+        command_ids = mb.add_commands(commands)
+
+        assert command_ids == ["id-1", "id-2"]
+        mock_instance.add_commands.assert_called_once_with(commands)
+
+
 def test_search_commands_default_fuzzy(sample_datetime):
     """Test search with default fuzzy matching enabled."""
     with patch("lib.api.Neo4jClient") as mock_client:
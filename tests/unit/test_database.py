@@ -1,6 +1,8 @@
 """Tests for database module."""
 
-from unittest.mock import Mock, patch
+import itertools
+from collections.abc import Callable, Generator
+from unittest.mock import Mock
 
 import pytest
 
@@ -8,10 +10,100 @@ from lib.database import Neo4jClient
 from lib.models import Command, CommandWithMetadata
 from lib.settings import Settings
 
-
-@pytest.fixture
+# Flat records as returned by the search/get projections, shared by the
+# tests below instead of being rebuilt inline per test.
+_SEARCH_RECORD = {
+    "id": "test-id",
+    "command": "git status",
+    "description": "Show status",
+    "context": None,
+    "status": None,
+    "created_at": "2023-01-01T00:00:00",
+    "last_used": None,
+    "use_count": 0,
+    "execution_count": 0,
+    "success_count": 0,
+    "failure_count": 0,
+    "tags": ["git"],
+    "oses": ["linux"],
+    "categories": ["git"],
+    "project_types": ["python"],
+}
+
+_GET_RECORD = {
+    "id": "test-id",
+    "command": "docker ps",
+    "description": "List containers",
+    "context": None,
+    "status": None,
+    "created_at": "2023-01-01T00:00:00",
+    "last_used": None,
+    "use_count": 1,
+    "execution_count": 0,
+    "success_count": 0,
+    "failure_count": 0,
+    "tags": ["docker"],
+    "oses": ["linux"],
+    "categories": ["docker"],
+    "project_types": [],
+}
+
+_TAG_RECORDS = ({"tag": "git"}, {"tag": "docker"}, {"tag": "python"})
+
+_CATEGORY_RECORDS = ({"category": "git"}, {"category": "docker"}, {"category": "kubernetes"})
+
+_INVALID_TIMESTAMP_RECORD = {
+    "id": "test-id",
+    "command": "test command",
+    "description": "test",
+    "context": None,
+    "status": None,
+    "created_at": None,  # Invalid timestamp
+    "last_used": None,
+    "use_count": 0,
+    "execution_count": 0,
+    "success_count": 0,
+    "failure_count": 0,
+    "tags": [],
+    "oses": [],
+    "categories": [],
+    "project_types": [],
+}
+
+
+class _FakeSession:
+    """Minimal stand-in for neo4j.Session covering what Neo4jClient touches.
+
+    run and close stay Mocks so tests can stub results and assert call
+    counts; everything else is a plain method, which is cheaper than a
+    full Mock tree and catches attribute typos at test time.
+    """
+
+    def __init__(self) -> None:
+        self.run = Mock()
+        self.close = Mock()
+
+    def __enter__(self) -> "_FakeSession":
+        return self
+
+    def __exit__(self, *args: object) -> bool:
+        return False
+
+
+class _FakeDriver:
+    """Minimal stand-in for neo4j.Driver handing out one shared session."""
+
+    def __init__(self, session: _FakeSession) -> None:
+        self._session = session
+        self.close = Mock()
+
+    def session(self, *args: object, **kwargs: object) -> _FakeSession:
+        return self._session
+
+
+@pytest.fixture(scope="session")
 def mock_settings() -> Settings:
-    """Create mock settings for testing."""
+    """Create mock settings once for the whole session."""
     return Settings(
         neo4j_uri="bolt://test:7687",
         neo4j_user="test_user",
@@ -20,81 +112,105 @@ def mock_settings() -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def mock_session() -> _FakeSession:
+    """Create a fake Neo4j session shared across the session."""
+    return _FakeSession()
+
+
+@pytest.fixture(scope="session")
+def mock_driver(mock_session: _FakeSession) -> _FakeDriver:
+    """Create a fake Neo4j driver shared across the session."""
+    return _FakeDriver(mock_session)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stable_uuid() -> Generator[None, None, None]:
+    """Make generated command IDs deterministic for this module.
+
+    add_commands needs distinct IDs within a batch, so a counter is used
+    rather than a constant value. Module scope keeps the patch installed
+    once for all tests here without leaking deterministic IDs into other
+    modules scheduled later on the same xdist worker.
+    """
+    counter = itertools.count()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("lib.database.uuid.uuid4", lambda: f"test-uuid-{next(counter)}")
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_driver: _FakeDriver, mock_session: _FakeSession) -> None:
+    """Reset the shared stubs so state doesn't leak between tests."""
+    mock_driver.close.reset_mock()
+    mock_session.run.reset_mock(return_value=True, side_effect=True)
+    mock_session.close.reset_mock()
+
+
 @pytest.fixture
-def mock_driver() -> Mock:
-    """Create a mock Neo4j driver."""
-    return Mock()
+def set_single(_reset_mocks: None, mock_session: _FakeSession) -> Callable[[dict | None], None]:
+    """Stub session.run with a result whose single() returns the given record.
+
+    The run.return_value.single chain is built once here rather than
+    auto-created anew by every test that assigns through it.
+    """
+    result = Mock()
+    mock_session.run.return_value = result
+
+    def _set(record: dict | None) -> None:
+        result.single.return_value = record
+
+    return _set
+
+
+@pytest.fixture(scope="module")
+def patched_graph_db() -> Generator[Mock, None, None]:
+    """Replace GraphDatabase with a mock once per module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mock_graph_database = Mock()
+        mp.setattr("lib.database.GraphDatabase", mock_graph_database)
+        yield mock_graph_database
 
 
 @pytest.fixture
-def mock_session() -> Mock:
-    """Create a mock Neo4j session."""
-    session = Mock()
-    session.__enter__ = Mock(return_value=session)
-    session.__exit__ = Mock(return_value=False)
-    return session
+def client(
+    _reset_mocks: None,
+    patched_graph_db: Mock,
+    mock_settings: Settings,
+    mock_driver: _FakeDriver,
+) -> Neo4jClient:
+    """Create a Neo4jClient wired to the mock driver and session."""
+    patched_graph_db.reset_mock()
+    patched_graph_db.driver.return_value = mock_driver
+    return Neo4jClient(mock_settings)
 
 
 class TestNeo4jClient:
     """Tests for Neo4jClient class."""
 
-    @patch("lib.database.GraphDatabase")
-    def test_client_initialization(
-        self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
-    ) -> None:
+    def test_client_initialization(self, client: Neo4jClient, patched_graph_db: Mock) -> None:
         """Test Neo4j client initialization."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-
-        client = Neo4jClient(mock_settings)
-
-        mock_graph_database.driver.assert_called_once_with(
+        patched_graph_db.driver.assert_called_once_with(
             "bolt://test:7687", auth=("test_user", "test_password")
         )
         assert client.database == "test_db"
 
-    @patch("lib.database.GraphDatabase")
-    def test_client_close(
-        self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
-    ) -> None:
+    def test_client_close(self, client: Neo4jClient, mock_driver: _FakeDriver) -> None:
         """Test closing Neo4j client connection."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-
-        client = Neo4jClient(mock_settings)
         client.close()
 
         mock_driver.close.assert_called_once()
 
-    @patch("lib.database.GraphDatabase")
-    @patch("lib.database.uuid.uuid4")
     def test_add_command(
         self,
-        mock_uuid: Mock,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
+        client: Neo4jClient,
+        mock_session: _FakeSession,
+        set_single: Callable[[dict | None], None],
     ) -> None:
         """Test adding a command to the database."""
-        mock_uuid.return_value = "test-uuid-123"
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-
-        # Mock the existing check to return None (command doesn't exist)
-        mock_result = Mock()
-        mock_result.single.return_value = None
-        mock_session.run.return_value = mock_result
-
-        client = Neo4jClient(mock_settings)
+        # The existing check returns None (command doesn't exist)
+        set_single(None)
+        run_count_before = mock_session.run.call_count
 
         cmd = Command(
             command="git status",
@@ -106,327 +222,179 @@ class TestNeo4jClient:
 
         command_id = client.add_command(cmd)
 
-        assert command_id == "test-uuid-123"
-        assert mock_session.run.call_count >= 2  # Check + Create queries
+        assert command_id.startswith("test-uuid-")
+        assert mock_session.run.call_count >= run_count_before + 2  # Check + Create queries
 
-    @patch("lib.database.GraphDatabase")
+    @pytest.mark.parametrize("records", [[_SEARCH_RECORD], []], ids=["hit", "miss"])
     def test_search_commands_with_query(
-        self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
+        self, client: Neo4jClient, mock_session: _FakeSession, records: list[dict]
     ) -> None:
-        """Test searching commands with a query string."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-
-        # Mock the query result
-        mock_record = Mock()
-        mock_record.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "c": {
-                    "id": "test-id",
-                    "command": "git status",
-                    "description": "Show status",
-                    "context": None,
-                    "created_at": "2023-01-01T00:00:00",
-                    "last_used": None,
-                    "use_count": 0,
-                    "execution_count": 0,
-                    "success_count": 0,
-                    "failure_count": 0,
-                },
-                "tags": ["git"],
-                "oses": ["linux"],
-                "categories": ["git"],
-                "project_types": ["python"],
-            }[key]
-        )
-
-        mock_session.run.return_value = [mock_record]
+        """Test searching commands with and without matching results."""
+        mock_session.run.return_value = records
 
-        client = Neo4jClient(mock_settings)
         commands = client.search_commands(query="status", limit=10)
 
-        assert len(commands) == 1
-        assert isinstance(commands[0], CommandWithMetadata)
-        assert commands[0].command == "git status"
+        assert len(commands) == len(records)
+        if records:
+            assert isinstance(commands[0], CommandWithMetadata)
+            assert commands[0].command == "git status"
 
-    @patch("lib.database.GraphDatabase")
-    def test_search_commands_no_results(
-        self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
-    ) -> None:
-        """Test searching commands with no results."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-        mock_session.run.return_value = []
+    def test_add_commands_bulk(self, client: Neo4jClient, mock_session: _FakeSession) -> None:
+        """Test adding multiple commands in a single batched query."""
+        run_count_before = mock_session.run.call_count
 
-        client = Neo4jClient(mock_settings)
-        commands = client.search_commands(query="nonexistent")
+        commands = [
+            Command(command="git status", description="Show status", tags=["git"]),
+            Command(command="docker ps", description="List containers", tags=["docker"]),
+        ]
 
-        assert commands == []
+        command_ids = client.add_commands(commands)
 
-    @patch("lib.database.GraphDatabase")
-    def test_get_command_found(
-        self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
-    ) -> None:
-        """Test getting a command by ID when it exists."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-
-        mock_record = Mock()
-        mock_record.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "c": {
-                    "id": "test-id",
-                    "command": "docker ps",
-                    "description": "List containers",
-                    "context": None,
-                    "created_at": "2023-01-01T00:00:00",
-                    "last_used": None,
-                    "use_count": 1,
-                    "execution_count": 0,
-                    "success_count": 0,
-                    "failure_count": 0,
-                },
-                "tags": ["docker"],
-                "oses": ["linux"],
-                "categories": ["docker"],
-                "project_types": [],
-            }[key]
-        )
-
-        mock_session.run.return_value.single.return_value = mock_record
+        assert len(command_ids) == 2
+        assert len(set(command_ids)) == 2  # Unique IDs
+        # One metadata-merge statement plus one UNWIND for the whole batch
+        assert mock_session.run.call_count == run_count_before + 2
 
-        client = Neo4jClient(mock_settings)
-        cmd = client.get_command("test-id")
+    def test_add_commands_empty_list(self, client: Neo4jClient, mock_session: _FakeSession) -> None:
+        """Test that an empty batch issues no query."""
+        run_count_before = mock_session.run.call_count
 
-        assert cmd is not None
-        assert isinstance(cmd, CommandWithMetadata)
-        assert cmd.id == "test-id"
-        assert cmd.command == "docker ps"
+        assert client.add_commands([]) == []
+        assert mock_session.run.call_count == run_count_before
 
-    @patch("lib.database.GraphDatabase")
-    def test_get_command_not_found(
-        self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
+    def test_search_commands_cached_result_reused(
+        self, client: Neo4jClient, mock_session: _FakeSession
     ) -> None:
-        """Test getting a command by ID when it doesn't exist."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-        mock_session.run.return_value.single.return_value = None
+        """Test that repeating an identical search hits the result cache."""
+        mock_session.run.return_value = []
+        run_count_before = mock_session.run.call_count
 
-        client = Neo4jClient(mock_settings)
-        cmd = client.get_command("nonexistent-id")
+        client.search_commands(query="status", limit=10)
+        run_count_after_first = mock_session.run.call_count
+        assert run_count_after_first == run_count_before + 1
 
-        assert cmd is None
+        # Identical query should be served from the cache
+        client.search_commands(query="status", limit=10)
+        assert mock_session.run.call_count == run_count_after_first
+        assert client.cache_stats()["hits"] == 1
 
-    @patch("lib.database.GraphDatabase")
-    def test_delete_command_success(
-        self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
+    def test_add_command_invalidates_search_cache(
+        self, client: Neo4jClient, mock_session: _FakeSession
     ) -> None:
-        """Test deleting a command successfully."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-
-        mock_record = Mock()
-        mock_record.__getitem__ = Mock(return_value=1)
-        mock_session.run.return_value.single.return_value = mock_record
+        """Test that adding a command clears cached search results."""
+        mock_session.run.return_value = []
+        client.search_commands(query="status", limit=10)
 
-        client = Neo4jClient(mock_settings)
-        result = client.delete_command("test-id")
+        mock_session.run.return_value = Mock(single=Mock(return_value=None))
+        client.add_command(Command(command="git status", description="Show status"))
 
-        assert result is True
+        run_count_after_add = mock_session.run.call_count
+        mock_session.run.return_value = []
+        client.search_commands(query="status", limit=10)
+        assert mock_session.run.call_count == run_count_after_add + 1
 
-    @patch("lib.database.GraphDatabase")
-    def test_delete_command_not_found(
+    @pytest.mark.parametrize("record", [_GET_RECORD, None], ids=["found", "not-found"])
+    def test_get_command(
         self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
+        client: Neo4jClient,
+        set_single: Callable[[dict | None], None],
+        record: dict | None,
     ) -> None:
-        """Test deleting a command that doesn't exist."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
+        """Test getting a command by ID whether or not it exists."""
+        set_single(record)
 
-        mock_record = Mock()
-        mock_record.__getitem__ = Mock(return_value=0)
-        mock_session.run.return_value.single.return_value = mock_record
-
-        client = Neo4jClient(mock_settings)
-        result = client.delete_command("nonexistent-id")
+        cmd = client.get_command("test-id")
 
-        assert result is False
+        if record is None:
+            assert cmd is None
+        else:
+            assert isinstance(cmd, CommandWithMetadata)
+            assert cmd.id == "test-id"
+            assert cmd.command == "docker ps"
 
-    @patch("lib.database.GraphDatabase")
-    def test_get_all_tags(
+    @pytest.mark.parametrize(
+        ("deleted", "expected"), [(1, True), (0, False)], ids=["success", "not-found"]
+    )
+    def test_delete_command(
         self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
+        client: Neo4jClient,
+        set_single: Callable[[dict | None], None],
+        deleted: int,
+        expected: bool,
     ) -> None:
-        """Test getting all tags."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-
-        mock_records = [{"tag": "git"}, {"tag": "docker"}, {"tag": "python"}]
-        mock_session.run.return_value = mock_records
+        """Test deleting an existing and a missing command."""
+        set_single({"deleted": deleted})
 
-        client = Neo4jClient(mock_settings)
-        tags = client.get_all_tags()
+        result = client.delete_command("test-id")
 
-        assert tags == ["git", "docker", "python"]
+        assert result is expected
 
-    @patch("lib.database.GraphDatabase")
-    def test_get_all_categories(
+    @pytest.mark.parametrize(
+        ("method", "records", "expected"),
+        [
+            ("get_all_tags", _TAG_RECORDS, ["docker", "git", "python"]),
+            ("get_all_categories", _CATEGORY_RECORDS, ["docker", "git", "kubernetes"]),
+        ],
+        ids=["tags", "categories"],
+    )
+    def test_get_all_metadata(
         self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
+        client: Neo4jClient,
+        mock_session: _FakeSession,
+        method: str,
+        records: tuple[dict, ...],
+        expected: list[str],
     ) -> None:
-        """Test getting all categories."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-
-        mock_records = [{"category": "git"}, {"category": "docker"}, {"category": "kubernetes"}]
-        mock_session.run.return_value = mock_records
+        """Test listing all tags/categories, including the in-process cache."""
+        mock_session.run.return_value = records
+        fetch = getattr(client, method)
 
-        client = Neo4jClient(mock_settings)
-        categories = client.get_all_categories()
+        assert fetch() == expected
 
-        assert categories == ["git", "docker", "kubernetes"]
+        # Second call is served from the in-process cache
+        run_count = mock_session.run.call_count
+        assert fetch() == expected
+        assert mock_session.run.call_count == run_count
 
 
 class TestEdgeCases:
     """Test edge cases."""
 
-    @patch("lib.database.GraphDatabase")
     def test_search_commands_skips_invalid_timestamps(
-        self, mock_graph_database: Mock, mock_settings: Settings
+        self, client: Neo4jClient, mock_session: _FakeSession
     ) -> None:
         """Test that search_commands skips records with invalid timestamps."""
-        mock_driver = Mock()
-        mock_session = Mock()
-        mock_result = Mock()
-
-        # Create a record with invalid timestamp (None)
-        mock_record = {
-            "c": {
-                "id": "test-id",
-                "command": "test command",
-                "description": "test",
-                "created_at": None,  # Invalid timestamp
-                "last_used": None,
-                "use_count": 0,
-                "execution_count": 0,
-                "success_count": 0,
-                "failure_count": 0,
-                "last_status": None,
-            },
-            "tags": [],
-            "oses": [],
-            "categories": [],
-            "project_types": [],
-        }
-
-        mock_result.__iter__ = Mock(return_value=iter([mock_record]))
-        mock_session.run.return_value = mock_result
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=False)
-        mock_driver.session.return_value = mock_session
-        mock_graph_database.driver.return_value = mock_driver
-
-        client = Neo4jClient(mock_settings)
+        mock_session.run.return_value = [_INVALID_TIMESTAMP_RECORD]
+
         results = client.search_commands("test")
 
         # Should return empty list because invalid timestamp was skipped
         assert results == []
 
-    @patch("lib.database.GraphDatabase")
     def test_get_command_returns_none_for_invalid_timestamp(
-        self, mock_graph_database: Mock, mock_settings: Settings
+        self, client: Neo4jClient, set_single: Callable[[dict | None], None]
     ) -> None:
         """Test that get_command returns None for invalid timestamps."""
-        mock_driver = Mock()
-        mock_session = Mock()
-        mock_result = Mock()
-
-        # Create a record with invalid timestamp
-        mock_record = {
-            "c": {
-                "id": "test-id",
-                "command": "test command",
-                "description": "test",
-                "created_at": None,  # Invalid
-                "last_used": None,
-                "use_count": 0,
-                "execution_count": 0,
-                "success_count": 0,
-                "failure_count": 0,
-                "last_status": None,
-            },
-            "tags": [],
-            "oses": [],
-            "categories": [],
-            "project_types": [],
-        }
-
-        mock_result.single.return_value = mock_record
-        mock_session.run.return_value = mock_result
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=False)
-        mock_driver.session.return_value = mock_session
-        mock_graph_database.driver.return_value = mock_driver
-
-        client = Neo4jClient(mock_settings)
+        set_single(_INVALID_TIMESTAMP_RECORD)
+
         result = client.get_command("test-id")
 
         assert result is None
 
-    @patch("lib.database.GraphDatabase")
-    @patch("lib.database._detect_category_and_tags")
     def test_validate_category_filters_invalid_category(
         self,
-        mock_detect: Mock,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
+        client: Neo4jClient,
+        set_single: Callable[[dict | None], None],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that invalid categories are filtered out during auto-detection."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=False)
-
         # Mock detection to return an invalid category (not in CATEGORIES_MAP)
-        mock_detect.return_value = ("invalid_category_not_in_map", [])
+        mock_detect = Mock(return_value=("invalid_category_not_in_map", []))
+        monkeypatch.setattr("lib.database._detect_category_and_tags", mock_detect)
 
-        # Mock existing command check to return None (new command)
-        mock_result = Mock()
-        mock_result.single.return_value = None
-        mock_session.run.return_value = mock_result
+        # Existing command check returns None (new command)
+        set_single(None)
 
-        client = Neo4jClient(mock_settings)
         cmd = Command(command="testcmd", description="test")
 
         client.add_command(cmd)
@@ -435,28 +403,12 @@ class TestEdgeCases:
         # and line 35 should execute (category validation)
         mock_detect.assert_called_once_with("testcmd")
 
-    @patch("lib.database.GraphDatabase")
     def test_search_with_query_only_no_filters(
-        self,
-        mock_graph_database: Mock,
-        mock_settings: Settings,
-        mock_driver: Mock,
-        mock_session: Mock,
+        self, client: Neo4jClient, mock_session: _FakeSession
     ) -> None:
         """Test search with only query parameter (no tags or relationship filters)."""
-        mock_graph_database.driver.return_value = mock_driver
-        mock_driver.session.return_value = mock_session
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=False)
-
-        mock_result = Mock()
-        # Make the result iterable (empty list)
-        mock_result.__iter__ = Mock(return_value=iter([]))
-        mock_session.run.return_value = mock_result
-
-        client = Neo4jClient(mock_settings)
+        mock_session.run.return_value = []
 
-        # Search with only query, no other filters - this should hit line 353
         results = client.search_commands(query="test", limit=10)
 
         assert results == []